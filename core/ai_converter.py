@@ -1,42 +1,140 @@
+import asyncio
 import json
 import re
+import orjson
 import os
 import sqlite3
-from typing import Dict, List, Any, Optional
-from core.config import AI_MODEL
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple
+from dataclasses import dataclass, field
+from core.config import AI_MODEL, REGION_CORRECTIONS, OBLAST_NAMES
 from loguru import logger
 from dotenv import load_dotenv
 import google.generativeai as genai
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
-from queue import Queue
+import atexit
+from collections import deque, OrderedDict
+from functools import lru_cache
 import time
 import random
+import copy
+import hashlib
+import numpy as np
 
 load_dotenv()
 
+# One pass over the whole message: a region header line ("Київщина:") or a weapon direction.
+# "Group/Groups KR" branch goes before the generic one and is case-insensitive.
+# [^\S\n] is whitespace that never crosses a line break; targets must start with a non-space.
+WEAPON_INFO_RE = re.compile(
+    r'^[^\S\n]*(?P<region>[^\n]*:)[^\S\n]*$'
+    r'|(?i:(?:(?P<groups>\d+)х?[^\S\n]+)?(?:ГРУПИ?|Групи?)[^\S\n]+КР[^\S\n]+курсом[^\S\n]+на[^\S\n]+(?P<group_target>\S[^\n]*))'
+    r'|(?:(?P<count>\d+)х?[^\S\n]+)?(?P<weapon>\S+)[^\S\n]+курсом[^\S\n]+на[^\S\n]+(?P<target>\S[^\n]*)',
+    re.MULTILINE
+)
+
+# Outermost JSON object in AI response, from the first "{" to the last "}"
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Prepared statements kept per thread connection, above sqlite3's default of 128 so the
+# per-chunk IN (...) lookups with varying placeholder counts don't evict the fixed hot queries
+STATEMENT_CACHE_SIZE = 256
+
+# Max cities per bulk lookup query, keeps bound variables under SQLite limits
+BULK_LOOKUP_CHUNK_SIZE = 400
+
+# Max regions sent to AI in one batched prompt, keeps the JSON answer within output limits
+AI_BATCH_MAX_REGIONS = 10
+
+# Resolved regions kept in memory between refresh cycles
+REGION_CACHE_SIZE = 512
+REGION_CACHE_TTL_SECONDS = 600
+
+# Ukraine bounding box (latitude, longitude) used to reject hallucinated coordinates
+UKRAINE_LAT_RANGE = (44.0, 52.5)
+UKRAINE_LON_RANGE = (22.0, 40.5)
+
+# Lowercase -> canonical region name, so known regions skip the str.title() walk
+_OBLAST_MAP = {name.lower(): name for name in OBLAST_NAMES}
+
+class CoordinatesRecord(NamedTuple):
+    """Coordinates row read from the cities or regions table"""
+    latitude: float
+    longitude: float
+    confidence: float
+    source: str
+
+@dataclass(slots=True)
+class RegionResult:
+    """Processed region with its targets, aggregated without dict lookups"""
+    region: str
+    targets: List[Dict[str, Any]] = field(default_factory=list)
+    weapons_count: int = 0
+    tokens_used: int = 0
+    coordinates_rn: Optional[Dict[str, float]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "region": self.region,
+            "targets": self.targets,
+            "total_processed": len(self.targets),
+            "tokens_used": self.tokens_used,
+            "weapons_count": self.weapons_count
+        }
+        if self.coordinates_rn is not None:
+            data["coordinates_rn"] = self.coordinates_rn
+        return data
+
+@lru_cache(maxsize=2048)
+def _normalize_region(region_name: str) -> str:
+    """
+    Normalize region name - fix typos and apply title case, memoized per raw name
+    
+    Args:
+        region_name: str - original region name
+        
+    Returns:
+        str - normalized region name with title case
+    """
+    lowered = region_name.strip().lower()
+    lowered = REGION_CORRECTIONS.get(lowered, lowered)
+    
+    return _OBLAST_MAP.get(lowered) or lowered.title()
+
+def validate_ukraine_coords_batch(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Check many coordinates against Ukraine bounding box at once
+    
+    Args:
+        lats: np.ndarray - latitudes
+        lons: np.ndarray - longitudes
+        
+    Returns:
+        np.ndarray - boolean mask, True where coordinates are within Ukraine
+    """
+    return np.logical_and.reduce([
+        lats >= UKRAINE_LAT_RANGE[0],
+        lats <= UKRAINE_LAT_RANGE[1],
+        lons >= UKRAINE_LON_RANGE[0],
+        lons <= UKRAINE_LON_RANGE[1]
+    ])
+
 class SQLiteFlow:
     """
     Class for working with SQLite database of cities coordinates
 
     Args:
         db_path: str - path to the database
-        pool_size: int - size of the connection pool
     """
-    def __init__(self, db_path: str = "db/cities_coordinates.db", pool_size: int = 5):
+    def __init__(self, db_path: str = "db/cities_coordinates.db"):
         self.db_path = db_path
-        self.pool_size = pool_size
-        self._connection_pool = Queue(maxsize=pool_size)
+        # One long-lived connection per thread, no pool lock on the hot path
+        self._tls = threading.local()
         self._lock = threading.Lock()
+        self._connections = []
+        atexit.register(self.close)
         
         self._init_database()
-        self._init_connection_pool()
         self.clean_region_duplicates()
-        
-        self.region_corrections = {
-            "хмельничена": "хмельниччина",
-            "хмельниченна": "хмельниччина"
-        }
     
     def _init_database(self):
         """
@@ -64,10 +162,16 @@ class SQLiteFlow:
                 )
             ''')
             
+            # Lookups by (city_name, region_name) use the UNIQUE constraint index
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cities_source 
+                ON cities(source)
+            ''')
+            
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS regions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    region_name TEXT NOT NULL UNIQUE,
+                    region_name TEXT NOT NULL COLLATE NOCASE UNIQUE,
                     latitude REAL NOT NULL,
                     longitude REAL NOT NULL,
                     confidence REAL DEFAULT 0.8,
@@ -75,26 +179,54 @@ class SQLiteFlow:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
+            
+            # Databases created before region_name got COLLATE NOCASE need a separate index
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'regions'")
+            if "COLLATE NOCASE" not in cursor.fetchone()[0]:
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_regions_name_nocase 
+                    ON regions(region_name COLLATE NOCASE)
+                ''')
+            
+            # Collect planner statistics once, PRAGMA optimize keeps them fresh afterwards
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if not cursor.fetchone():
+                cursor.execute("ANALYZE")
             conn.commit()
             logger.success(f"Database initialized: {self.db_path}")
     
-    def _init_connection_pool(self):
-        """Initialize connection pool for SQLite
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open and tune a new connection for the current thread
         
         Args:
             None
             
         Returns:
-            None
+            Connection - connection to the database
         """
-        for _ in range(self.pool_size):
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            self._connection_pool.put(conn)
+        conn = sqlite3.connect(
+            self.db_path,
+            # Closed from the main thread at exit
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            # Autocommit: single writes commit on their own, batches use explicit BEGIN IMMEDIATE/COMMIT
+            isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=1073741824")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA foreign_keys=ON")
+        
+        self._tls.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+        return conn
     
-    def _get_connection(self):
-        """Get connection from pool
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the current thread's connection, opening it on first use
         
         Args:
             None
@@ -102,19 +234,27 @@ class SQLiteFlow:
         Returns:
             Connection - connection to the database
         """
-        return self._connection_pool.get()
+        return getattr(self._tls, 'conn', None) or self._create_connection()
     
-    def _return_connection(self, conn):
-        """Return connection to pool
+    def close(self):
+        """Optimize and close every per-thread connection
         
         Args:
-            conn: Connection - connection to the database
+            None
             
         Returns:
             None
         """
-        self._connection_pool.put(conn)
-    
+        with self._lock:
+            connections, self._connections = self._connections, []
+        
+        for conn in connections:
+            try:
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error closing DB connection: {e}")
+
     def normalize_region_name(self, region_name: str) -> str:
         """
         Normalize region name - fix typos and apply title case
@@ -125,15 +265,9 @@ class SQLiteFlow:
         Returns:
             str - normalized region name with title case
         """
-        cleaned = region_name.strip().lower()
-        
-        if cleaned in self.region_corrections:
-            corrected = self.region_corrections[cleaned]
-            return corrected.title()
-        
-        return region_name.strip().title()
+        return _normalize_region(region_name)
     
-    def get_city_coordinates(self, city_name: str, region_name: str) -> Optional[Dict[str, Any]]:
+    def get_city_coordinates(self, city_name: str, region_name: str) -> Optional[CoordinatesRecord]:
         """
         Get city coordinates from database
         
@@ -142,39 +276,73 @@ class SQLiteFlow:
             region_name: str - region name
             
         Returns:
-            Optional[Dict[str, Any]] - dictionary with city coordinates
+            Optional[CoordinatesRecord] - city coordinates
         """
         try:
-            normalized_region = self.normalize_region_name(region_name)
+            normalized_region = _normalize_region(region_name)
             
             conn = self._get_connection()
-            try:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT latitude, longitude, confidence, source 
-                    FROM cities 
-                    WHERE city_name = ? AND region_name = ?
-                ''', (city_name, normalized_region))
-                
-                result = cursor.fetchone()
-                if result:
-                    latitude, longitude, confidence, source = result
-                    logger.info(f"Found in DB: {city_name}, {region_name}")
-                    return {
-                        "coordinates": {
-                            "latitude": latitude,
-                            "longitude": longitude
-                        },
-                        "confidence": confidence,
-                        "source": f"database_{source}"
-                    }
-                return None
-            finally:
-                self._return_connection(conn)
+            result = conn.execute('''
+                SELECT latitude, longitude, confidence, source 
+                FROM cities 
+                WHERE city_name = ? AND region_name = ?
+            ''', (city_name, normalized_region)).fetchone()
+            if result:
+                latitude, longitude, confidence, source = result
+                logger.info(f"Found in DB: {city_name}, {region_name}")
+                return CoordinatesRecord(latitude, longitude, confidence, f"database_{source}")
+            return None
         except Exception as e:
             logger.error(f"Error reading from DB: {e}")
             return None
     
+    def get_cities_coordinates_bulk(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], CoordinatesRecord]:
+        """
+        Get coordinates of many cities from database in one query
+        
+        Args:
+            pairs: List[Tuple[str, str]] - (city_name, region_name) pairs
+            
+        Returns:
+            Dict[Tuple[str, str], CoordinatesRecord] - city coordinates keyed by
+                (city_name, normalized region_name)
+        """
+        found = {}
+        if not pairs:
+            return found
+        
+        # Cities grouped per normalized region: "region_name = ? AND city_name IN (...)"
+        # is a SEARCH on the (city_name, region_name) index, a row-value IN (VALUES ...) is a full index scan
+        cities_by_region: Dict[str, set] = {}
+        for city, region in pairs:
+            cities_by_region.setdefault(_normalize_region(region), set()).add(city)
+        
+        try:
+            conn = self._get_connection()
+            for region_name, cities in cities_by_region.items():
+                cities = sorted(cities)
+                for start in range(0, len(cities), BULK_LOOKUP_CHUNK_SIZE):
+                    chunk = cities[start:start + BULK_LOOKUP_CHUNK_SIZE]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    
+                    rows = conn.execute(f'''
+                        SELECT city_name, region_name, latitude, longitude, confidence, source 
+                        FROM cities 
+                        WHERE region_name = ? AND city_name IN ({placeholders})
+                    ''', (region_name, *chunk)).fetchall()
+                    
+                    for city_name, region_name_db, latitude, longitude, confidence, source in rows:
+                        found[(city_name, region_name_db)] = CoordinatesRecord(
+                            latitude, longitude, confidence, f"database_{source}"
+                        )
+        except Exception as e:
+            logger.error(f"Error reading cities batch from DB: {e}")
+            return {}
+        
+        total = sum(len(cities) for cities in cities_by_region.values())
+        logger.info(f"Found in DB: {len(found)}/{total} cities")
+        return found
+    
     def save_city_coordinates(
         self, city_name: str, region_name: str, latitude: float, 
         longitude: float, confidence: float = 0.8, source: str = "AI"
@@ -197,22 +365,67 @@ class SQLiteFlow:
             if not self._validate_ukraine_coordinates(latitude, longitude):
                 return False
             
-            normalized_region = self.normalize_region_name(region_name)
+            normalized_region = _normalize_region(region_name)
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
+            conn = self._get_connection()
+            conn.execute('''
+                INSERT OR REPLACE INTO cities 
+                (city_name, region_name, latitude, longitude, confidence, source)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (city_name, normalized_region, latitude, longitude, confidence, source))
+            
+            return True
+                
+        except Exception as e:
+            logger.error(f"Error saving to DB: {e}")
+            return False
+    
+    def save_city_coordinates_bulk(self, rows: List[Tuple[str, str, float, float, float, str]]) -> int:
+        """
+        Save many city coordinates to database in a single transaction
+        
+        Args:
+            rows: List[Tuple[str, str, float, float, float, str]] - rows of
+                (city_name, region_name, latitude, longitude, confidence, source)
+
+        Returns:
+            int - number of saved rows
+        """
+        if not rows:
+            return 0
+        
+        try:
+            lats = np.fromiter((row[2] for row in rows), dtype=float, count=len(rows))
+            lons = np.fromiter((row[3] for row in rows), dtype=float, count=len(rows))
+            valid_mask = validate_ukraine_coords_batch(lats, lons)
+            
+            valid_rows = [
+                (city_name, _normalize_region(region_name), latitude, longitude, confidence, source)
+                for (city_name, region_name, latitude, longitude, confidence, source), is_valid in zip(rows, valid_mask)
+                if is_valid
+            ]
+            if not valid_rows:
+                return 0
+            
+            conn = self._get_connection()
+            # One explicit transaction for the whole batch: a single WAL commit instead of one per row
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany('''
                     INSERT OR REPLACE INTO cities 
                     (city_name, region_name, latitude, longitude, confidence, source)
                     VALUES (?, ?, ?, ?, ?, ?)
-                ''', (city_name, normalized_region, latitude, longitude, confidence, source))
-                
-                conn.commit()
-                return True
+                ''', valid_rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.rollback()
+                raise
+            
+            return len(valid_rows)
                 
         except Exception as e:
-            logger.error(f"Error saving to DB: {e}")
-            return False
+            logger.error(f"Error saving cities batch to DB: {e}")
+            return 0
     
     def _validate_ukraine_coordinates(self, latitude: float, longitude: float) -> bool:
         """
@@ -225,7 +438,7 @@ class SQLiteFlow:
         Returns:
             bool - True if coordinates are within Ukraine, False otherwise
         """
-        return (44.0 <= latitude <= 52.5) and (22.0 <= longitude <= 40.5)
+        return (UKRAINE_LAT_RANGE[0] <= latitude <= UKRAINE_LAT_RANGE[1]) and (UKRAINE_LON_RANGE[0] <= longitude <= UKRAINE_LON_RANGE[1])
     
     # def city_exists_with_different_coordinates(self, city_name: str, region_name: str, 
     #     latitude: float, 
@@ -268,7 +481,7 @@ class SQLiteFlow:
     #         logger.error(f"Error checking duplicates: {e}")
     #         return False
     
-    def get_region_coordinates(self, region_name: str) -> Optional[Dict[str, Any]]:
+    def get_region_coordinates(self, region_name: str) -> Optional[CoordinatesRecord]:
         """
         Get region coordinates from database (case-insensitive search)
         
@@ -276,30 +489,21 @@ class SQLiteFlow:
             region_name: str - region name
             
         Returns:
-            Optional[Dict[str, Any]] - dictionary with region coordinates
+            Optional[CoordinatesRecord] - region coordinates
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT latitude, longitude, confidence, source 
-                    FROM regions 
-                    WHERE LOWER(region_name) = LOWER(?)
-                ''', (region_name.strip(),))
-                
-                result = cursor.fetchone()
-                if result:
-                    latitude, longitude, confidence, source = result
-                    logger.info(f"Found region in DB: {region_name}")
-                    return {
-                        "coordinates": {
-                            "latitude": latitude,
-                            "longitude": longitude
-                        },
-                        "confidence": confidence,
-                        "source": f"database_{source}"
-                    }
-                return None
+            conn = self._get_connection()
+            result = conn.execute('''
+                SELECT latitude, longitude, confidence, source 
+                FROM regions 
+                WHERE region_name = ? COLLATE NOCASE
+            ''', (_normalize_region(region_name),)).fetchone()
+            
+            if result:
+                latitude, longitude, confidence, source = result
+                logger.info(f"Found region in DB: {region_name}")
+                return CoordinatesRecord(latitude, longitude, confidence, f"database_{source}")
+            return None
         except Exception as e:
             logger.error(f"Error reading region from DB: {e}")
             return None
@@ -326,29 +530,22 @@ class SQLiteFlow:
                 logger.warning(f"Region coordinates {region_name} out of Ukraine: {latitude}, {longitude}")
                 return False
             
-            normalized_region = self.normalize_region_name(region_name)
+            normalized_region = _normalize_region(region_name)
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT id FROM regions 
-                    WHERE LOWER(region_name) = LOWER(?)
-                ''', (normalized_region,))
-                
-                if cursor.fetchone():
-                    logger.info(f"Region {region_name} already exists in DB, skipping save")
-                    return True
-                
-                cursor.execute('''
-                    INSERT INTO regions 
-                    (region_name, latitude, longitude, confidence, source)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (normalized_region, latitude, longitude, confidence, source))
-                
-                conn.commit()
-                logger.info(f"Saved region to DB: {normalized_region} -> {latitude}, {longitude}")
+            conn = self._get_connection()
+            # Names are stored normalized, so UNIQUE(region_name) catches existing regions
+            cursor = conn.execute('''
+                INSERT OR IGNORE INTO regions 
+                (region_name, latitude, longitude, confidence, source)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (normalized_region, latitude, longitude, confidence, source))
+            
+            if cursor.rowcount == 0:
+                logger.info(f"Region {region_name} already exists in DB, skipping save")
                 return True
+            
+            logger.info(f"Saved region to DB: {normalized_region} -> {latitude}, {longitude}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving region to DB: {e}")
@@ -362,54 +559,38 @@ class SQLiteFlow:
             int - number of duplicates removed
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Find case-insensitive duplicates
-                cursor.execute('''
-                    SELECT LOWER(region_name) as lower_name, 
-                           COUNT(*) as count,
-                           GROUP_CONCAT(id) as ids,
-                           GROUP_CONCAT(region_name) as names
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Latest entry (highest id) of every case-insensitive duplicate group is kept
+                kept = conn.execute('''
+                    SELECT MAX(id), region_name 
                     FROM regions 
-                    GROUP BY LOWER(region_name) 
+                    GROUP BY region_name COLLATE NOCASE 
                     HAVING COUNT(*) > 1
-                ''')
-                
-                duplicates = cursor.fetchall()
-                total_removed = 0
-                
-                for lower_name, count, ids_str, names_str in duplicates:
-                    ids = [int(x) for x in ids_str.split(',')]
-                    names = names_str.split(',')
-                    
-                    logger.info(f"Found {count} case variations for region: {lower_name}")
-                    logger.info(f"Variations: {names}")
-                    
-                    # Keep the latest entry (highest id) and normalize its name
-                    latest_id = max(ids)
-                    latest_index = ids.index(latest_id)
-                    latest_name = names[latest_index]
-                    
-                    # Normalize and update the latest entry
-                    normalized_name = self.normalize_region_name(latest_name)
-                    cursor.execute('''
-                        UPDATE regions 
-                        SET region_name = ? 
-                        WHERE id = ?
-                    ''', (normalized_name, latest_id))
-                    
-                    # Remove all other entries
-                    for region_id in ids:
-                        if region_id != latest_id:
-                            cursor.execute('DELETE FROM regions WHERE id = ?', (region_id,))
-                            total_removed += 1
-                    
-                    logger.info(f"Kept {normalized_name} (id: {latest_id}), removed {count-1} duplicates")
-                
-                conn.commit()
-                logger.info(f"Total region duplicates removed: {total_removed}")
-                return total_removed
+                ''').fetchall()
+            
+                total_removed = conn.execute('''
+                    DELETE FROM regions 
+                    WHERE id NOT IN (
+                        SELECT MAX(id) FROM regions GROUP BY region_name COLLATE NOCASE
+                    )
+                ''').rowcount
+            
+                # Normalize names only after duplicates are gone, so UNIQUE(region_name) can't clash
+                conn.executemany('''
+                    UPDATE regions 
+                    SET region_name = ? 
+                    WHERE id = ?
+                ''', [(_normalize_region(name), region_id) for region_id, name in kept])
+            
+                conn.execute("COMMIT")
+            except Exception:
+                conn.rollback()
+                raise
+            
+            logger.info(f"Total region duplicates removed: {total_removed}")
+            return total_removed
                 
         except Exception as e:
             logger.error(f"Error cleaning duplicates: {e}")
@@ -423,32 +604,25 @@ class SQLiteFlow:
             Dict[str, Any] - dictionary with database statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Total number of cities
-                cursor.execute('SELECT COUNT(*) FROM cities')
-                total_cities = cursor.fetchone()[0]
-                
-                # Total number of regions from cities table
-                cursor.execute('SELECT COUNT(DISTINCT region_name) FROM cities')
-                total_regions_cities = cursor.fetchone()[0]
-                
-                # Total number of regions from regions table
-                cursor.execute('SELECT COUNT(*) FROM regions')
-                total_regions_coords = cursor.fetchone()[0]
-                
-                # Data sources
-                cursor.execute('SELECT source, COUNT(*) FROM cities GROUP BY source')
-                sources = dict(cursor.fetchall())
-                
-                return {
-                    "total_cities": total_cities,
-                    "total_regions": total_regions_cities,
-                    "total_regions_with_coords": total_regions_coords,
-                    "sources": sources,
-                    "database_path": self.db_path
-                }
+            conn = self._get_connection()
+            # Cities, distinct regions in cities table and regions with coordinates in one round-trip
+            total_cities, total_regions_cities, total_regions_coords = conn.execute('''
+                SELECT 
+                    (SELECT COUNT(*) FROM cities),
+                    (SELECT COUNT(DISTINCT region_name) FROM cities),
+                    (SELECT COUNT(*) FROM regions)
+            ''').fetchone()
+            
+            # Data sources
+            sources = dict(conn.execute('SELECT source, COUNT(*) FROM cities GROUP BY source').fetchall())
+            
+            return {
+                "total_cities": total_cities,
+                "total_regions": total_regions_cities,
+                "total_regions_with_coords": total_regions_coords,
+                "sources": sources,
+                "database_path": self.db_path
+            }
         except Exception as e:
             logger.error(f"Error getting statistics: {e}")
             return {}
@@ -458,24 +632,37 @@ class AIConverter:
     Class for converting input data to JSON dictionary
 
     Args:
-        api_delay: float - delay between API calls
+        api_delay: float - base delay for rate limit backoff
         max_retries: int - maximum number of retries
+        requests_per_minute: int - maximum number of API calls per minute
+        max_workers: int - maximum number of concurrent AI requests
     """
-    def __init__(self, api_delay: float = 2.0, max_retries: int = 3):
+    def __init__(self, api_delay: float = 2.0, max_retries: int = 3, requests_per_minute: int = 30, max_workers: int = 2):
         self.api_key = os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             logger.error("GOOGLE_API_KEY not found")
             raise ValueError("GOOGLE_API_KEY not found")
         
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(AI_MODEL)
+        self.model = genai.GenerativeModel(
+            AI_MODEL,
+            generation_config={"response_mime_type": "application/json"}
+        )
         
         self.db = SQLiteFlow()
         self.api_delay = api_delay
         self.max_retries = max_retries 
-        self._last_api_call = 0
-        self._api_lock = threading.Lock()
+        self.requests_per_minute = requests_per_minute
+        self.max_workers = max_workers
+        self._api_call_times = deque()
+        # Bounds in-flight AI requests across all proccess_data calls on this instance
+        self._api_semaphore = asyncio.Semaphore(max_workers)
+        # LRU of resolved regions: content hash -> (stored at, region coordinates)
+        self._region_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
         self.instructions = self._load_model_instructions()
+        # Static prompt parts are built once, each request only adds its JSON input
+        self._prompt_prefix = self.instructions.strip() + "\n\nINPUT:\n"
+        self._prompt_suffix = "\n\nRETURN ONLY JSON:"
         
     def _load_model_instructions(self) -> str:
         """
@@ -498,52 +685,46 @@ class AIConverter:
             Dict[str, List[Dict[str, Any]]] - dictionary with regions and weapons
         """
         regions = {}
-        
-        lines = text.strip().split('\n')
         current_region = None
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.endswith(':'):
-                current_region = line.replace(':', '')
+        for line_match in WEAPON_INFO_RE.finditer(text):
+            region = line_match['region']
+            if region is not None:
+                current_region = region.replace(':', '')
                 if current_region not in regions:
                     regions[current_region] = []
                 continue
             
-            if current_region:
-                # Special processing for "Group/Groups KR"
-                group_kr_match = re.search(r'(?:(\d+)х?\s+)?(?:ГРУПИ?|Групи?)\s+КР\s+курсом\s+на\s+(.+)', line, re.IGNORECASE)
-                if group_kr_match:
-                    count_str, target_city = group_kr_match.groups()
-                    groups_count = int(count_str) if count_str else 1
-                    total_count = groups_count * 2  # Each group = 2 units
-                    
-                    
-                    regions[current_region].append({
-                        'weapon_type': "Х101",
-                        'count': total_count,
-                        'target_city': target_city.strip()
-                    })
-                    continue
+            if not current_region:
+                continue
+            
+            # Special processing for "Group/Groups KR"
+            if line_match['group_target'] is not None:
+                count_str = line_match['groups']
+                groups_count = int(count_str) if count_str else 1
+                total_count = groups_count * 2  # Each group = 2 units
                 
-                # Regular pattern for other weapon types
-                standard_match = re.search(r'(?:(\d+)х?\s+)?(\S+)\s+курсом\s+на\s+(.+)', line)
-                if standard_match:
-                    count_str, weapon_type, target_city = standard_match.groups()
-                    count = int(count_str) if count_str else 1
-                    
-                    # Mapping for regular KR (without "group" word)
-                    if weapon_type.upper() == "КР":
-                        weapon_type = "Х101"
-                                        
-                    regions[current_region].append({
-                        'weapon_type': weapon_type,
-                        'count': count,
-                        'target_city': target_city.strip()
-                    })
+                regions[current_region].append({
+                    'weapon_type': "Х101",
+                    'count': total_count,
+                    'target_city': line_match['group_target'].strip()
+                })
+                continue
+            
+            # Regular pattern for other weapon types
+            count_str = line_match['count']
+            count = int(count_str) if count_str else 1
+            weapon_type = line_match['weapon']
+            
+            # Mapping for regular KR (without "group" word)
+            if weapon_type.upper() == "КР":
+                weapon_type = "Х101"
+                                
+            regions[current_region].append({
+                'weapon_type': weapon_type,
+                'count': count,
+                'target_city': line_match['target'].strip()
+            })
         
         logger.info(f"Found regions: {list(regions.keys())}")
         # for region, weapons in regions.items():
@@ -551,7 +732,30 @@ class AIConverter:
         
         return regions
 
-    def _rate_limited_api_call(self, prompt: str) -> Optional[str]:
+    async def _acquire_api_slot(self) -> None:
+        """
+        Wait until an API call fits into the requests-per-minute window
+        
+        Token bucket over the timestamps of recent calls - bookkeeping never
+        awaits, so it is atomic on the event loop and needs no lock
+        
+        Returns:
+            None
+        """
+        while True:
+            now = time.monotonic()
+            while self._api_call_times and now - self._api_call_times[0] >= 60:
+                self._api_call_times.popleft()
+            
+            if len(self._api_call_times) < self.requests_per_minute:
+                self._api_call_times.append(now)
+                return
+            
+            sleep_time = 60 - (now - self._api_call_times[0])
+            logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
+
+    async def _rate_limited_api_call(self, prompt: str) -> Optional[str]:
         """
         Make API call with rate limiting and retry logic
         
@@ -561,160 +765,388 @@ class AIConverter:
         Returns:
             Optional[str] - response from AI or None
         """
-        with self._api_lock:
-            current_time = time.time()
-            time_since_last_call = current_time - self._last_api_call
-            
-            if time_since_last_call < self.api_delay:
-                sleep_time = self.api_delay - time_since_last_call
-                logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-            
-            for attempt in range(self.max_retries):
-                try:
-                    logger.info(f"Making API call (attempt {attempt + 1}/{self.max_retries})")
-                    response = self.model.generate_content(prompt)
-                    self._last_api_call = time.time()
+        for attempt in range(self.max_retries):
+            await self._acquire_api_slot()
+            try:
+                logger.info(f"Making API call (attempt {attempt + 1}/{self.max_retries})")
+                async with self._api_semaphore:
+                    response = await self.model.generate_content_async(prompt)
+                
+                if response and response.text:
+                    return response.text.strip()
+                else:
+                    logger.warning("Empty response from Gemini API")
                     
-                    if response and response.text:
-                        return response.text.strip()
+            except Exception as e:
+                error_message = str(e)
+                logger.error(f"Gemini API error (attempt {attempt + 1}): {error_message}")
+                
+                if "quota" in error_message.lower() or "429" in error_message:
+                    if attempt < self.max_retries - 1:
+                        backoff_time = (2 ** attempt) * 10 + random.uniform(1, 5)
+                        logger.info(f"Quota exceeded, waiting {backoff_time:.2f} seconds before retry")
+                        await asyncio.sleep(backoff_time)
                     else:
-                        logger.warning("Empty response from Gemini API")
-                        
-                except Exception as e:
-                    error_message = str(e)
-                    logger.error(f"Gemini API error (attempt {attempt + 1}): {error_message}")
-                    
-                    if "quota" in error_message.lower() or "429" in error_message:
-                        if attempt < self.max_retries - 1:
-                            backoff_time = (2 ** attempt) * 10 + random.uniform(1, 5)
-                            logger.info(f"Quota exceeded, waiting {backoff_time:.2f} seconds before retry")
-                            time.sleep(backoff_time)
-                        else:
-                            logger.error("Max retries exceeded for quota error")
-                            return None
-                    elif "rate limit" in error_message.lower():
-                        if attempt < self.max_retries - 1:
-                            backoff_time = self.api_delay * (2 ** attempt) + random.uniform(1, 3)
-                            logger.info(f"Rate limit hit, waiting {backoff_time:.2f} seconds before retry")
-                            time.sleep(backoff_time)
-                        else:
-                            logger.error("Max retries exceeded for rate limit error")
-                            return None
+                        logger.error("Max retries exceeded for quota error")
+                        return None
+                elif "rate limit" in error_message.lower():
+                    if attempt < self.max_retries - 1:
+                        backoff_time = self.api_delay * (2 ** attempt) + random.uniform(1, 3)
+                        logger.info(f"Rate limit hit, waiting {backoff_time:.2f} seconds before retry")
+                        await asyncio.sleep(backoff_time)
                     else:
-                        if attempt < self.max_retries - 1:
-                            time.sleep(1 + random.uniform(0.5, 1.5))
-                
-                self._last_api_call = time.time()
-            
-            logger.error(f"All {self.max_retries} attempts failed")
-            return None
+                        logger.error("Max retries exceeded for rate limit error")
+                        return None
+                else:
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(1 + random.uniform(0.5, 1.5))
+        
+        logger.error(f"All {self.max_retries} attempts failed")
+        return None
 
-    def get_region_coordinates_from_ai(self, region_name: str, weapons_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _lookup_region_in_db(
+        self, region_name: str, weapons_list: List[Dict[str, Any]]
+    ) -> Tuple[Optional[CoordinatesRecord], List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Get region coordinates from prompt to AI
+        Resolve region and its targets from database
         
         Args:
             region_name: str - region name
             weapons_list: List[Dict[str, Any]] - list of weapons
             
         Returns:
-            Dict[str, Any] - dictionary with region coordinates
+            Tuple[Optional[CoordinatesRecord], List[Dict[str, Any]], List[Dict[str, Any]]] -
+                region coordinates, targets found in DB and weapons still needing AI
         """
         targets = []
         weapons_for_ai = []
         
-        region_coords = self.db.get_region_coordinates(region_name)
+        region_coords = await asyncio.to_thread(self.db.get_region_coordinates, region_name)
+        
+        normalized_region = _normalize_region(region_name)
+        cities_coords = await asyncio.to_thread(
+            self.db.get_cities_coordinates_bulk,
+            [(weapon['target_city'], region_name) for weapon in weapons_list]
+        )
         
         for weapon in weapons_list:
             city_name = weapon['target_city']
-            db_coords = self.db.get_city_coordinates(city_name, region_name)
+            db_coords = cities_coords.get((city_name, normalized_region))
             
             if db_coords:
                 targets.append({
                     "city": city_name,
                     "weapon_type": weapon['weapon_type'],
                     "count": weapon['count'],
-                    "coordinates": db_coords['coordinates'],
-                    "confidence": db_coords['confidence'],
-                    "source": db_coords['source']
+                    "coordinates": {
+                        "latitude": db_coords.latitude,
+                        "longitude": db_coords.longitude
+                    },
+                    "confidence": db_coords.confidence,
+                    "source": db_coords.source
                 })
             else:
                 weapons_for_ai.append(weapon)
         
-        if weapons_for_ai or not region_coords:
-            logger.info(f"Request to AI for {len(weapons_for_ai)} cities from {region_name}")
-            
-            input_data = {
-                "region": region_name,
-                "weapons": weapons_for_ai
-            }
-            
-            prompt = f"""
-                {self.instructions}
+        return region_coords, targets, weapons_for_ai
 
-                INPUT:
-                {json.dumps(input_data, ensure_ascii=False)}
+    async def _request_regions_from_ai(self, regions_input: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get coordinates for many regions with a single prompt to AI
+        
+        Args:
+            regions_input: List[Dict[str, Any]] - list of {"region": ..., "weapons": [...]}
+            
+        Returns:
+            Dict[str, Dict[str, Any]] - AI answer per input region name, or {"error": ...}
+        """
+        logger.info(f"Request to AI for {sum(len(r['weapons']) for r in regions_input)} cities from {len(regions_input)} regions")
+        
+        prompt = self._prompt_prefix + orjson.dumps({"regions": regions_input}).decode() + self._prompt_suffix
+        response_text = await self._rate_limited_api_call(prompt)
+        
+        if response_text is None:
+            logger.error("Failed to get response from API after all retries")
+            return {r["region"]: {"error": "api_error"} for r in regions_input}
+        
+        try:
+            ai_result = orjson.loads(self.clean_json_response(response_text))
+            ai_regions = ai_result["regions"]
+            if not isinstance(ai_regions, list):
+                raise TypeError(f"'regions' must be a list, got {type(ai_regions).__name__}")
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.error(f"JSON parsing error: {e}")
+            logger.error(f"Raw response: {response_text}")
+            return {r["region"]: {"error": "json_parse_error"} for r in regions_input}
+        
+        answers_by_name = {answer.get("region"): answer for answer in ai_regions if isinstance(answer, dict)}
+        answers = {}
+        for index, region_input in enumerate(regions_input):
+            answer = answers_by_name.get(region_input["region"])
+            # The model may rewrite a region name (toponymic rules), fall back to its position
+            if answer is None and len(ai_regions) == len(regions_input) and isinstance(ai_regions[index], dict):
+                answer = ai_regions[index]
+            answers[region_input["region"]] = answer if answer is not None else {"error": "missing_in_response"}
+        
+        return answers
 
-                RETURN ONLY JSON:""".strip()
+    async def _request_batches_from_ai(self, batches: List[List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Send region batches to AI concurrently, a failed batch only fails its own regions
+        
+        Args:
+            batches: List[List[Dict[str, Any]]] - batches of {"region": ..., "weapons": [...]}
+            
+        Returns:
+            Dict[str, Dict[str, Any]] - AI answer per input region name, or {"error": ...}
+        """
+        answers = {}
+        batch_results = await asyncio.gather(
+            *(self._request_regions_from_ai(batch) for batch in batches), return_exceptions=True
+        )
+        for batch, batch_answers in zip(batches, batch_results):
+            if isinstance(batch_answers, BaseException):
+                logger.error(f"AI request failed for regions {[r['region'] for r in batch]}: {batch_answers}")
+                batch_answers = {r["region"]: {"error": "ai_request_error"} for r in batch}
+            answers.update(batch_answers)
+        
+        return answers
 
-            try:
-                response_text = self._rate_limited_api_call(prompt)
-                
-                if response_text is None:
-                    logger.error("Failed to get response from API after all retries")
-                    return {"error": "api_error"}
-                
-                cleaned_response = self.clean_json_response(response_text)
-                ai_result = json.loads(cleaned_response)
-                
-                if 'region_coordinates' in ai_result and not region_coords:
-                    reg_coords = ai_result['region_coordinates']
-                    self.db.save_region_coordinates(
-                        region_name=region_name,
-                        latitude=reg_coords['latitude'],
-                        longitude=reg_coords['longitude'],
-                        confidence=ai_result.get('region_confidence', 0.8),
-                        source='Gemini'
-                    )
-                    region_coords = {
-                        "coordinates": reg_coords,
-                        "confidence": ai_result.get('region_confidence', 0.8),
-                        "source": "database_Gemini"
-                    }
+    async def _save_ai_region(
+        self, region_name: str, ai_result: Dict[str, Any],
+        region_coords: Optional[CoordinatesRecord], targets: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge AI answer for one region with DB data and save new coordinates
+        
+        Args:
+            region_name: str - region name
+            ai_result: Dict[str, Any] - AI answer for the region
+            region_coords: Optional[CoordinatesRecord] - region coordinates from DB
+            targets: List[Dict[str, Any]] - targets already found in DB
+            
+        Returns:
+            Dict[str, Any] - dictionary with region coordinates
+        """
+        if 'error' in ai_result:
+            return ai_result
+        
+        try:
+            if 'region_coordinates' in ai_result and not region_coords:
+                reg_coords = ai_result['region_coordinates']
+                await asyncio.to_thread(
+                    self.db.save_region_coordinates,
+                    region_name=region_name,
+                    latitude=reg_coords['latitude'],
+                    longitude=reg_coords['longitude'],
+                    confidence=ai_result.get('region_confidence', 0.8),
+                    source='Gemini'
+                )
+                region_coords = CoordinatesRecord(
+                    reg_coords['latitude'],
+                    reg_coords['longitude'],
+                    ai_result.get('region_confidence', 0.8),
+                    "database_Gemini"
+                )
+            
+            if 'targets' in ai_result:
+                city_rows = []
+                for target in ai_result['targets']:
+                    targets.append(target)
+                    
+                    coords = target['coordinates']
+                    city_rows.append((
+                        target['city'],
+                        region_name,
+                        coords['latitude'],
+                        coords['longitude'],
+                        target.get('confidence', 0.8),
+                        'Gemini'
+                    ))
+                await asyncio.to_thread(self.db.save_city_coordinates_bulk, city_rows)
                 
-                if 'targets' in ai_result:
-                    for target in ai_result['targets']:
-                        targets.append(target)
-                        
-                        coords = target['coordinates']
-                        self.db.save_city_coordinates(
-                            city_name=target['city'],
-                            region_name=region_name,
-                            latitude=coords['latitude'],
-                            longitude=coords['longitude'],
-                            confidence=target.get('confidence', 0.8),
-                            source='Gemini'
-                        )
-                        
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON parsing error: {e}")
-                logger.error(f"Raw response: {response_text}")
-                return {"error": "json_parse_error"}
-            except Exception as e:
-                logger.error(f"General processing error: {e}")
-                return {"error": "processing_error"}
+        except Exception as e:
+            logger.error(f"General processing error: {e}")
+            return {"error": "processing_error"}
         
+        return self._region_coordinates_result(region_name, targets, region_coords)
+
+    def _region_coordinates_result(
+        self, region_name: str, targets: List[Dict[str, Any]], region_coords: Optional[CoordinatesRecord]
+    ) -> Dict[str, Any]:
+        """
+        Build region coordinates dictionary
+        
+        Args:
+            region_name: str - region name
+            targets: List[Dict[str, Any]] - resolved targets
+            region_coords: Optional[CoordinatesRecord] - region coordinates
+            
+        Returns:
+            Dict[str, Any] - dictionary with region coordinates
+        """
         result = {
             "region": region_name,
             "targets": targets
         }
         
         if region_coords:
-            result["coordinates_rn"] = region_coords['coordinates']
+            result["coordinates_rn"] = {
+                "latitude": region_coords.latitude,
+                "longitude": region_coords.longitude
+            }
             
         return result
 
+    def _region_cache_key(self, region_name: str, weapons_list: List[Dict[str, Any]]) -> str:
+        """
+        Build cache key from region name and its weapons, independent of weapons order
+        
+        Args:
+            region_name: str - region name
+            weapons_list: List[Dict[str, Any]] - list of weapons
+            
+        Returns:
+            str - content hash of the inputs
+        """
+        weapons_lines = sorted(
+            f"{weapon['weapon_type']}|{weapon['count']}|{weapon['target_city']}" for weapon in weapons_list
+        )
+        payload = region_name.encode() + b"|" + "\n".join(weapons_lines).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _get_cached_region(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get resolved region from cache if it's not expired
+        
+        Args:
+            key: str - cache key
+            
+        Returns:
+            Optional[Dict[str, Any]] - copy of cached region coordinates or None
+        """
+        entry = self._region_cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, result = entry
+        if time.monotonic() - stored_at > REGION_CACHE_TTL_SECONDS:
+            del self._region_cache[key]
+            return None
+        
+        self._region_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _cache_region(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store resolved region in cache, evicting the least recently used entry
+        
+        Args:
+            key: str - cache key
+            result: Dict[str, Any] - region coordinates
+            
+        Returns:
+            None
+        """
+        self._region_cache[key] = (time.monotonic(), copy.deepcopy(result))
+        self._region_cache.move_to_end(key)
+        if len(self._region_cache) > REGION_CACHE_SIZE:
+            self._region_cache.popitem(last=False)
+
+    async def get_regions_coordinates_from_ai(
+        self, regions_weapons: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get coordinates for all regions: memory cache, then DB, then one batched prompt to AI for the rest
+        
+        Args:
+            regions_weapons: Dict[str, List[Dict[str, Any]]] - weapons grouped by region
+            
+        Returns:
+            Dict[str, Dict[str, Any]] - dictionary with region coordinates per region name
+        """
+        cache_keys = {
+            region_name: self._region_cache_key(region_name, weapons_list)
+            for region_name, weapons_list in regions_weapons.items()
+        }
+        cached = {}
+        for region_name, key in cache_keys.items():
+            cached_result = self._get_cached_region(key)
+            if cached_result is not None:
+                cached[region_name] = cached_result
+        if cached:
+            logger.info(f"{len(cached)} of {len(regions_weapons)} regions served from cache")
+        
+        pending_regions = [region_name for region_name in regions_weapons if region_name not in cached]
+        lookup_results = await asyncio.gather(
+            *(self._lookup_region_in_db(region_name, regions_weapons[region_name]) for region_name in pending_regions),
+            return_exceptions=True
+        )
+        # A failing region never cancels the others, it only gets its own error entry
+        lookups = {}
+        resolved = {}
+        for region_name, lookup in zip(pending_regions, lookup_results):
+            if isinstance(lookup, BaseException):
+                logger.error(f"DB lookup failed for region {region_name}: {lookup}")
+                resolved[region_name] = {"error": "db_lookup_error"}
+            else:
+                lookups[region_name] = lookup
+        
+        regions_input = [
+            {"region": region_name, "weapons": weapons_for_ai}
+            for region_name, (region_coords, _, weapons_for_ai) in lookups.items()
+            if weapons_for_ai or not region_coords
+        ]
+        
+        ai_answers = {}
+        if regions_input:
+            batches = [
+                regions_input[start:start + AI_BATCH_MAX_REGIONS]
+                for start in range(0, len(regions_input), AI_BATCH_MAX_REGIONS)
+            ]
+            ai_answers.update(await self._request_batches_from_ai(batches))
+            
+            # Regions the batch answer dropped are retried one by one
+            missing = [r for r in regions_input if ai_answers[r["region"]].get("error") == "missing_in_response"]
+            if missing:
+                logger.warning(f"{len(missing)} regions missing in batched AI response, retrying separately")
+                ai_answers.update(await self._request_batches_from_ai([[r] for r in missing]))
+        
+        async def resolve(region_name: str) -> Dict[str, Any]:
+            region_coords, targets, _ = lookups[region_name]
+            if region_name not in ai_answers:
+                return self._region_coordinates_result(region_name, targets, region_coords)
+            return await self._save_ai_region(region_name, ai_answers[region_name], region_coords, targets)
+        
+        results = await asyncio.gather(*(resolve(region_name) for region_name in lookups), return_exceptions=True)
+        for region_name, result in zip(lookups, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to resolve region {region_name}: {result}")
+                result = {"error": "processing_error"}
+            resolved[region_name] = result
+        for region_name, result in resolved.items():
+            if 'error' not in result:
+                self._cache_region(cache_keys[region_name], result)
+        
+        return {
+            region_name: cached[region_name] if region_name in cached else resolved[region_name]
+            for region_name in regions_weapons
+        }
+
+    async def get_region_coordinates_from_ai(self, region_name: str, weapons_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get region coordinates from prompt to AI
+        
+        Args:
+            region_name: str - region name
+            weapons_list: List[Dict[str, Any]] - list of weapons
+            
+        Returns:
+            Dict[str, Any] - dictionary with region coordinates
+        """
+        results = await self.get_regions_coordinates_from_ai({region_name: weapons_list})
+        return results[region_name]
+
     def clean_json_response(self, response: str) -> str:
         """
         Clean JSON response from prompt to AI
@@ -725,32 +1157,23 @@ class AIConverter:
         Returns:
             str - cleaned response
         """
-        response = re.sub(r'```json\s*', '', response)
-        response = re.sub(r'\s*```', '', response)
-        
-        start_idx = response.find('{')
-        if start_idx == -1:
+        json_match = JSON_OBJECT_RE.search(response)
+        if not json_match:
             return response
         
-        end_idx = response.rfind('}') + 1
-        if end_idx <= start_idx:
-            return response
-        
-        return response[start_idx:end_idx].strip()
+        return json_match.group(0)
 
-    def _process_single_region(self, region_name: str, weapons_list: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Process single region with weapons list
+    def _process_single_region(self, region_name: str, coords_data: Dict[str, Any]) -> Optional[RegionResult]:
+        """Build region data from resolved region coordinates
         
         Args:
             region_name: str - region name
-            weapons_list: List[Dict[str, Any]] - list of weapons
+            coords_data: Dict[str, Any] - dictionary with region coordinates
             
         Returns:
-            Optional[Dict[str, Any]] - dictionary with region data or None
+            Optional[RegionResult] - region data or None
         """
         try:
-            coords_data = self.get_region_coordinates_from_ai(region_name, weapons_list)
-            
             if 'error' not in coords_data and 'targets' in coords_data:
                 region_targets = []
                 region_weapons_count = 0
@@ -768,18 +1191,13 @@ class AIConverter:
                     
                     region_weapons_count += target["count"]
                 
-                region_data = {
-                    "region": region_name,
-                    "targets": region_targets,
-                    "total_processed": len(region_targets),
-                    "tokens_used": 100,
-                    "weapons_count": region_weapons_count
-                }
-                
-                if 'coordinates_rn' in coords_data:
-                    region_data["coordinates_rn"] = coords_data['coordinates_rn']
-                
-                return region_data
+                return RegionResult(
+                    region=region_name,
+                    targets=region_targets,
+                    weapons_count=region_weapons_count,
+                    tokens_used=100,
+                    coordinates_rn=coords_data.get('coordinates_rn')
+                )
             else:
                 logger.error(f"Error processing region {region_name}: {coords_data}")
                 return None
@@ -787,80 +1205,58 @@ class AIConverter:
             logger.error(f"Exception processing region {region_name}: {e}")
             return None
 
-    def proccess_data(self, data: str, max_workers: int = 2) -> Dict[str, Any]:
+    async def proccess_data(self, data: str) -> Dict[str, Any]:
         """
-        Process data and return dictionary with regions and weapons (parallel version)
+        Process data and return dictionary with regions and weapons (batched version)
         
         Args:
             data: str - input data
-            max_workers: int - maximum number of parallel workers
             
         Returns:
             Dict[str, Any] - dictionary with regions and weapons
         """
         regions_weapons = self.extract_weapon_info(data)
         
-        regions_data = []
-        total_weapons_count = 0
-        all_weapon_types = set()
-        total_cities = 0
+        started_at = time.monotonic()
         
-        logger.info(f"Processing {len(regions_weapons)} regions with max_workers={max_workers}")
+        logger.info(f"Processing {len(regions_weapons)} regions with max_workers={self.max_workers}")
         
-        if max_workers == 1:
-            for region_name, weapons_list in regions_weapons.items():
-                try:
-                    region_data = self._process_single_region(region_name, weapons_list)
-                    if region_data:
-                        regions_data.append(region_data)
-                        
-                        total_weapons_count += region_data.get("weapons_count", 0)
-                        total_cities += len(region_data["targets"])
-                        
-                        for target in region_data["targets"]:
-                            all_weapon_types.add(target["weapon_type"])
-                        
-                        logger.info(f"Successfully processed region: {region_name}")
-                    else:
-                        logger.error(f"Failed to process region: {region_name}")
-                except Exception as e:
-                    logger.error(f"Exception for region {region_name}: {e}")
-        else:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_region = {
-                    executor.submit(self._process_single_region, region_name, weapons_list): region_name
-                    for region_name, weapons_list in regions_weapons.items()
-                }
-                
-                for future in as_completed(future_to_region):
-                    region_name = future_to_region[future]
-                    try:
-                        region_data = future.result()
-                        if region_data:
-                            regions_data.append(region_data)
-                            
-                            total_weapons_count += region_data.get("weapons_count", 0)
-                            total_cities += len(region_data["targets"])
-                            
-                            for target in region_data["targets"]:
-                                all_weapon_types.add(target["weapon_type"])
-                            
-                            logger.info(f"Successfully processed region: {region_name}")
-                        else:
-                            logger.error(f"Failed to process region: {region_name}")
-                    except Exception as e:
-                        logger.error(f"Exception for region {region_name}: {e}")
+        # DB lookups run concurrently in worker threads, regions missing from DB go to AI
+        # in one batched prompt; only Gemini calls (batches, retries) are bounded.
+        try:
+            coords_by_region = await self.get_regions_coordinates_from_ai(regions_weapons)
+        except Exception as e:
+            logger.error(f"Exception resolving regions: {e}")
+            coords_by_region = {}
+        
+        region_results = [
+            self._process_single_region(region_name, coords_by_region.get(region_name, {"error": "not_processed"}))
+            for region_name in regions_weapons
+        ]
+        for region_name, region_result in zip(regions_weapons, region_results):
+            if region_result is None:
+                logger.error(f"Failed to process region: {region_name}")
+        regions_data = [r for r in region_results if r is not None]
+        
+        total_weapons_count = sum(r.weapons_count for r in regions_data)
+        total_cities = sum(len(r.targets) for r in regions_data)
+        all_weapon_types = {t["weapon_type"] for r in regions_data for t in r.targets}
+        
+        logger.info(
+            f"Processed {len(regions_data)}/{len(regions_weapons)} regions in {time.monotonic() - started_at:.1f}s, "
+            f"failed={len(regions_weapons) - len(regions_data)}, weapons={total_weapons_count}"
+        )
         
         result = {
-            "regions": regions_data,
+            "regions": [r.to_dict() for r in regions_data],
             "total_regions": len(regions_data),
             "total_cities": total_cities,
             "total_weapons_used": list(all_weapon_types),
             "total_weapons_count": total_weapons_count,
-            "total_tokens_used": sum(r.get("tokens_used", 0) for r in regions_data),
-            "processing_mode": "sequential" if max_workers == 1 else "parallel", 
+            "total_tokens_used": sum(r.tokens_used for r in regions_data),
+            "processing_mode": "sequential" if self.max_workers == 1 else "parallel", 
             "status": "success",
-            "database_stats": self.db.get_database_stats()
+            "database_stats": await asyncio.to_thread(self.db.get_database_stats)
         }
         
         return result
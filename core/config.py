@@ -21,11 +21,27 @@ UA_NAME_MAP = {
      'Lysychansk': 'Лисичанськ',
 }
 
+# Region name typos seen in channel messages
+REGION_CORRECTIONS = {
+    "хмельничена": "хмельниччина",
+    "хмельниченна": "хмельниччина",
+}
+
+# Canonical region names as they appear in channel headers
+OBLAST_NAMES = (
+    'Вінниччина', 'Волинь', 'Дніпропетровщина', 'Донеччина', 'Житомирщина',
+    'Закарпаття', 'Запоріжжя', 'Івано-Франківщина', 'Київщина', 'Кіровоградщина',
+    'Луганщина', 'Львівщина', 'Миколаївщина', 'Одещина', 'Полтавщина',
+    'Рівненщина', 'Сумщина', 'Тернопільщина', 'Харківщина', 'Херсонщина',
+    'Хмельниччина', 'Черкащина', 'Чернівеччина', 'Чернігівщина',
+    'Київ', 'Крим', 'Севастополь',
+)
+
 # Excluded cities in map
-EXCLUDED_CITIES = (
+EXCLUDED_CITIES = frozenset((
     'лисичанськ', 'макіївка', 
     'ізмаїл', 'іллічівськ', 'горлівка'
-)
+))
 
 COLORS = {
     'background': '#0f1115', 
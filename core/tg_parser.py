@@ -1,8 +1,9 @@
 import asyncio
 import os
+import re
 from typing import Dict, Any, Optional, AsyncGenerator
-from datetime import datetime
-from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from dataclasses import dataclass
 from loguru import logger
 from pyrogram import Client
 from pyrogram.errors import (
@@ -10,11 +11,19 @@ from pyrogram.errors import (
 )
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
-from core.utils import delete_simillar_routes
+from core.utils import RouteMerger
 
 load_dotenv()
 
-@dataclass
+# Messages older than this are not current routes anymore
+MAX_MESSAGE_AGE = timedelta(minutes=20)
+
+# Service posts (daily summary, launch reports, KAB alerts) that carry no routes
+SKIP_TEXTS_RE = re.compile('|'.join(map(re.escape, (
+    'Ситуація станом на 00:00', 'Зафіксовано пуски ударних', 'Пуски КАБ'
+))))
+
+@dataclass(slots=True, frozen=True)
 class TelegramMessage:
     """Simple structure for storing Telegram message data"""
     message_id: int
@@ -22,9 +31,11 @@ class TelegramMessage:
     date: datetime
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['date'] = self.date.isoformat()
-        return data
+        return {
+            'message_id': self.message_id,
+            'text': self.text,
+            'date': self.date.isoformat()
+        }
 
 class TelegramParser:
     def __init__(self, 
@@ -42,7 +53,8 @@ class TelegramParser:
         self.api_id = os.getenv("TELEGRAM_API_ID")
         self.api_hash = os.getenv("TELEGRAM_API_HASH")
         self.phone_number = os.getenv("TELEGRAM_PHONE")
-        self.channel_name = os.getenv("TELEGRAM_CHANNEL")
+        channel_name = os.getenv("TELEGRAM_CHANNEL") or ""
+        self.channel_name = channel_name[1:] if channel_name.startswith('@') else channel_name
         self.session_name = session_name
 
         session_dir = "telegram_sessions"
@@ -63,7 +75,10 @@ class TelegramParser:
             rotation="1 day",
             retention="7 days",
             level="INFO",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+            # Writes go through a background queue in 64 KB chunks, off the event loop
+            enqueue=True,
+            buffering=65536
         )
         
         self.stats = {
@@ -113,9 +128,6 @@ class TelegramParser:
             Dict with channel information or None if channel not found
         """
         try:
-            if self.channel_name.startswith('@'):
-                self.channel_name = self.channel_name[1:]
-                
             chat = await self.client.get_chat(self.channel_name)
             
             return {
@@ -147,34 +159,28 @@ class TelegramParser:
             TelegramMessage: Message object
         """
         try:
-            if self.channel_name.startswith('@'):
-                self.channel_name = self.channel_name[1:]
-            
             channel_info = await self.get_channel_info()
             if not channel_info:
                 return
             
             message_count = 0
             
-            now = datetime.now(ZoneInfo('Europe/Kyiv'))
+            cutoff = datetime.now(ZoneInfo('Europe/Kyiv')) - MAX_MESSAGE_AGE
             
             async for message in self.client.get_chat_history(
                 chat_id=self.channel_name,
                 limit=limit
             ):
                 try:
-                    await asyncio.sleep(0.1)
-  
                     msg_date = message.date
                     if msg_date.tzinfo is None:
                         msg_date = msg_date.replace(tzinfo=ZoneInfo('Europe/Kyiv'))
                     
-                    message_age = now - msg_date
-                    age_seconds = message_age.total_seconds()
-
-                    texts = ('Ситуація станом на 00:00', 'Зафіксовано пуски ударних', 'Пуски КАБ')
+                    # History comes newest first, so every message after the first stale one is stale too
+                    if msg_date < cutoff:
+                        break
 
-                    if age_seconds > 20 * 60 or any(text in message.text for text in texts):
+                    if not message.text or SKIP_TEXTS_RE.search(message.text):
                         continue
                 
                     
@@ -190,7 +196,7 @@ class TelegramParser:
                     yield telegram_message
                     
                     if message_count % 50 == 0:
-                        logger.info(f"Processed {message_count} messages from channel {self.channel_name}")
+                        logger.debug(f"Processed {message_count} messages from channel {self.channel_name}")
                         
                 except FloodWait as e:
                     await asyncio.sleep(e.value)
@@ -207,16 +213,19 @@ class TelegramParser:
         self.stats['start_time'] = datetime.now()
         self.stats['total_channels'] = 1
         
-        all_messages = []
+        merger = RouteMerger()
+        received = 0
         
         logger.info(f"Starting channel parsing {self.channel_name}")
         
+        # Messages are merged as they arrive instead of being collected first
         async for message in self.parse_channel_messages(
             limit=7
         ):
-            all_messages.append(message)        
+            merger.ingest(message)
+            received += 1
         self.stats['end_time'] = datetime.now()
 
-        logger.info(f"Total received {len(all_messages)} messages")
-        cleared = delete_simillar_routes(all_messages)
+        logger.info(f"Total received {received} messages")
+        cleared = merger.finalize()
         return cleared
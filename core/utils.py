@@ -1,49 +1,91 @@
-def delete_simillar_routes(routes: list):
+import re
+
+# Non-blank line with surrounding whitespace trimmed, group 1 is the stripped text
+LINE_RE = re.compile(r'^[^\S\n]*(\S(?:[^\n]*\S)?)[^\S\n]*$', re.MULTILINE)
+
+class RouteMerger:
     """
-    Merge routes from different messages by regions with saving the latest message
+    Incremental merge of routes by regions, keeping the latest message per region
     
-    Args:
-        routes: List of TelegramMessage objects
-        
-    Returns:
-        String with merged routes by regions
+    Messages are fed one at a time with ingest(), so callers don't have to keep
+    the whole message list; finalize() builds the merged text.
     """
-    region_messages = {}
+    def __init__(self):
+        self.region_messages = {}
     
-    for message in routes:
-        if not message.text:
-            continue
+    def ingest(self, message):
+        """
+        Add routes from one message
+        
+        Args:
+            message: TelegramMessage object
             
-        lines = message.text.strip().split('\n')
+        Returns:
+            None
+        """
+        text = message.text
+        if not text:
+            return
+        
         current_region = None
         content = []
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.endswith(':'):
+        # Content lines are kept as (start, end) offsets into text, sliced only for the final result
+        for match in LINE_RE.finditer(text):
+            start, end = match.span(1)
+            
+            if text[end - 1] == ':':
                 if current_region and content:
-                    _save_region(region_messages, current_region, content, message.date)
+                    _save_region(self.region_messages, current_region, text, content, message.date)
                 
-                current_region = line
+                current_region = text[start:end]
                 content = []
 
             elif current_region:
-                content.append(line)
+                content.append((start, end))
         
         if current_region and content:
-            _save_region(region_messages, current_region, content, message.date)
+            _save_region(self.region_messages, current_region, text, content, message.date)
+    
+    def finalize(self) -> str:
+        """
+        Build merged routes text
+        
+        Returns:
+            String with merged routes by regions
+        """
+        result_lines = []
+        for region, saved in sorted(self.region_messages.items()):
+            text = saved['text']
+            result_lines.append(region)
+            result_lines.extend(text[start:end] for start, end in saved['content'])
+            result_lines.append("")
+        
+        # Lines are already trimmed, only the separator after the last region has to go
+        while result_lines and result_lines[-1] == "":
+            result_lines.pop()
+        
+        return "\n".join(result_lines)
+
+def delete_simillar_routes(routes: list):
+    """
+    Merge routes from different messages by regions with saving the latest message
     
-    result_lines = []
-    for region in sorted(region_messages.keys()):
-        result_lines.append(region)
-        result_lines.extend(region_messages[region]['content'])
-        result_lines.append("")
+    Args:
+        routes: List of TelegramMessage objects
+        
+    Returns:
+        String with merged routes by regions
+    """
+    if not routes:
+        return ""
+    
+    merger = RouteMerger()
+    for message in routes:
+        merger.ingest(message)
     
-    return "\n".join(result_lines).strip()
+    return merger.finalize()
 
-def _save_region(region_messages, region, content, date):
+def _save_region(region_messages, region, text, content, date):
     if region not in region_messages or date > region_messages[region]['date']:
-        region_messages[region] = {'content': content.copy(), 'date': date}
\ No newline at end of file
+        region_messages[region] = {'text': text, 'content': content, 'date': date}
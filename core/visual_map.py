@@ -1,11 +1,13 @@
 import geopandas as gpd
 import matplotlib.pyplot as plt
 import contextily as ctx
-import pandas as pd
 import numpy as np
 import matplotlib.transforms as transforms
 import matplotlib.patches as patches
 from shapely.geometry import Point
+from shapely import STRtree, points, union_all
+from shapely.prepared import prep
+from pyproj import Transformer
 import os
 import random
 from typing import List, Tuple, Optional
@@ -15,38 +17,116 @@ from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from matplotlib import font_manager
+from matplotlib.font_manager import FontProperties
+import core.config
 from core.config import (
     COLORS, LABEL, NO_TARGETS_MESSAGE, UA_NAME_MAP, 
     EXCLUDED_CITIES, WEAPON_ICONS, 
     WEAPON_ICON_ROTATION_OFFSET_DEG, WEAPON_COLORS
 )
-from io import BytesIO
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
+from loguru import logger
 load_dotenv()
 
+# City names, exclusions and colors come from config, so caches built with them are rebuilt when it changes
+_CONFIG_PATH = core.config.__file__
+
+# Lower-case weapon spellings -> canonical weapon type, anything else is treated as БпЛА
+_WEAPON_CANON = {
+    **dict.fromkeys(('uav', 'бпла', 'дрон', 'дрон-камікадзе', 'шахед', 'shahed', 'гермес', 'бпа'), 'БпЛА'),
+    **dict.fromkeys(('x101', 'х101', 'крилата ракета', 'крилатая ракета', 'cruise', 'cruise_missile'), 'х101'),
+    **dict.fromkeys(('balistic', 'ballistic', 'балістика', 'баллистика', 'кинжал', 'kinzhal'), 'Балістика'),
+}
+
 class VisualMap:
+    # Lon/lat -> Web Mercator for whole coordinate arrays at once
+    _to_3857 = Transformer.from_crs(4326, 3857, always_xy=True)
+
+    # Icon placement only needs a coarse inside-oblast test, meters in EPSG:3857
+    _ICON_REGION_SIMPLIFY_TOLERANCE = 2000
+
+    # City label style shared by every label on every render
+    _city_label_kwargs = {
+        'fontproperties': FontProperties(size=5, weight='bold'),
+        'color': COLORS['city_label'],
+        'ha': 'center',
+        'va': 'bottom',
+        'alpha': 0.95,
+    }
+
+    # Overlay fonts are resolved and parsed once per process
+    _FONT_PATH = font_manager.findfont('DejaVu Sans')
+    _FONT_16 = ImageFont.truetype(_FONT_PATH, 16)
+    _FONT_28 = ImageFont.truetype(_FONT_PATH, 28)
+    _FONT_30 = ImageFont.truetype(_FONT_PATH, 30)
+
     def __init__(self, full_json_data: dict):
         self.full_json_data = full_json_data
         self.shapes_path = "shapes"
+        self.cache_path = "cache"
         self.channel_name = os.getenv("TELEGRAM_CHANNEL")
 
-        self._geodata_cache = {}
-        self._svg_cache = {}
-        
         with ThreadPoolExecutor(max_workers=4) as executor:
             ukraine_future = executor.submit(self.load_ukraine)
             regions_future = executor.submit(self.load_regions)
             cities_future = executor.submit(self.load_ukraine_cities)
+            areas_future = executor.submit(self._read_areas_3857_cache)
             
             self.ukraine = ukraine_future.result()
             self.regions = regions_future.result()
             self.cities = cities_future.result()
+            cached_areas = areas_future.result()
+        
+        # Everything is drawn in EPSG:3857, so project once here instead of per render/target;
+        # the Crimea union and projection only run when the projected cache is missing or stale
+        self.ukraine_3857, self.oblasts_3857 = cached_areas if cached_areas is not None else self._load_areas_3857()
+        self.cities_3857 = self.cities.to_crs(3857) if self.cities is not None else None
+
+        # Oblast index for matching and prepared boundaries for icon placement, built once per instance
+        self.oblasts_tree = STRtree(self.oblasts_3857.geometry.values)
+        self._prepared_oblasts = {}
         
         self.target_data = self._get_target_data()
         self.target_point = [target['point'] for target in self.target_data]
+        self.target_points_3857 = points(
+            [target['x'] for target in self.target_data],
+            [target['y'] for target in self.target_data]
+        )
         self.region_target_mapping = None
 
+    def _read_areas_3857_cache(self) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame] | None:
+        """Read Ukraine area (with Crimea) and oblasts in EPSG:3857 from cache
+        
+        Returns:
+            tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]: Ukraine GeoDataFrame, Oblasts GeoDataFrame | None
+        """
+        # Projected areas depend on both admin_0 and admin_1 shapefiles
+        sources = [
+            self._shapefile_path("ne_10m_admin_0_countries"),
+            self._shapefile_path("ne_10m_admin_1_states_provinces"),
+        ]
+        ukraine_3857 = self._read_geodata_cache("ukraine_3857", sources)
+        oblasts_3857 = self._read_geodata_cache("oblasts_3857", sources)
+        if ukraine_3857 is None or oblasts_3857 is None:
+            return None
+        return ukraine_3857, oblasts_3857
+
+    def _load_areas_3857(self) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
+        """Build Ukraine area (with Crimea) and oblasts in EPSG:3857 from loaded shapefiles and cache them
+        
+        Returns:
+            tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]: Ukraine GeoDataFrame, Oblasts GeoDataFrame
+        """
+        ukraine_area, oblasts = self.add_crimea(self.ukraine, self.regions)
+        ukraine_3857 = ukraine_area.to_crs(3857)
+        oblasts_3857 = oblasts.to_crs(3857)
+        self._write_geodata_cache("ukraine_3857", ukraine_3857)
+        self._write_geodata_cache("oblasts_3857", oblasts_3857)
+        return ukraine_3857, oblasts_3857
+
     def _get_target_data(self) -> List[dict]:
         """Get target data from the full JSON data with complete information
         
@@ -54,18 +134,34 @@ class VisualMap:
             List[dict]: Target data with coordinates, weapon type, count, and city info
         """
         target_data = []
+        lons = []
+        lats = []
+        # Totals per canonical weapon type for the info panels, counted in the same pass
+        self._weapon_counts = Counter()
 
         for region in self.full_json_data['regions']:
             for target in region['targets']:
-                target_point = Point(target['longitude'], target['latitude'])
-                target_info = {
-                    'point': target_point,
-                    'weapon_type': target.get('weapon_type', 'БпЛА'),
-                    'count': target.get('count', 1),
+                lons.append(target['longitude'])
+                lats.append(target['latitude'])
+                weapon_type = target.get('weapon_type', 'БпЛА')
+                count = target.get('count', 1)
+                target_data.append({
+                    'weapon_type': weapon_type,
+                    'count': count,
                     'city': target.get('city', ''),
                     'region': region.get('region', '')
-                }
-                target_data.append(target_info)
+                })
+                self._weapon_counts[self._canon_weapon_type(weapon_type)] += int(count or 1)
+
+        # All target points are built and projected in one vectorized call each
+        lons = np.asarray(lons, dtype=float)
+        lats = np.asarray(lats, dtype=float)
+        target_points = points(lons, lats)
+        xs_3857, ys_3857 = self._to_3857.transform(lons, lats)
+        for target_info, target_point, x, y in zip(target_data, target_points, xs_3857.tolist(), ys_3857.tolist()):
+            target_info['point'] = target_point
+            target_info['x'] = x
+            target_info['y'] = y
 
         return target_data
 
@@ -81,6 +177,70 @@ class VisualMap:
         
         return next((p for p in paths if os.path.exists(p)), None)
 
+    def _shapefile_path(self, name: str) -> str | None:
+        """Find Natural Earth shapefile in its own folder or in the shapes root
+        
+        Args:
+            name: Shapefile name without extension
+
+        Returns:
+            Str: Path to the shapefile | None
+        """
+        return self._first_existing([
+            os.path.join(self.shapes_path, name, f"{name}.shp"),
+            os.path.join(self.shapes_path, f"{name}.shp"),
+        ])
+
+    def _is_cache_fresh(self, cache_file: str, source_paths: List[str | None]) -> bool:
+        """Check that cache file is newer than its sources, config and this module
+        
+        Args:
+            cache_file: Cache file path
+            source_paths: Data files the cache was built from
+
+        Returns:
+            bool: True if cache can be used
+        """
+        # Config and code (projection, simplification, styling) are part of every cache key
+        sources = [*source_paths, _CONFIG_PATH, __file__]
+        if not os.path.exists(cache_file) or not all(sources):
+            return False
+        return os.path.getmtime(cache_file) >= max(os.path.getmtime(p) for p in sources)
+
+    def _read_geodata_cache(self, name: str, source_paths: List[str | None]) -> gpd.GeoDataFrame | None:
+        """Read GeoDataFrame from GeoParquet cache if it is up to date
+        
+        Args:
+            name: Cache entry name
+            source_paths: Shapefiles the entry was built from
+
+        Returns:
+            GeoDataFrame: Cached data | None
+        """
+        cache_file = os.path.join(self.cache_path, f"{name}.parquet")
+        try:
+            if not self._is_cache_fresh(cache_file, source_paths):
+                return None
+            return gpd.read_parquet(cache_file)
+        except Exception:
+            return None
+
+    def _write_geodata_cache(self, name: str, gdf: gpd.GeoDataFrame) -> None:
+        """Write GeoDataFrame to GeoParquet cache, a failed write only costs a reload next time
+        
+        Args:
+            name: Cache entry name
+            gdf: Data to cache
+
+        Returns:
+            None
+        """
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            gdf.to_parquet(os.path.join(self.cache_path, f"{name}.parquet"))
+        except Exception:
+            pass
+
     def load_ukraine(self) -> gpd.GeoDataFrame:
         """Load Ukraine from shapefile
         
@@ -88,17 +248,17 @@ class VisualMap:
             GeoDataFrame: Ukraine
         """
         
-        out_dir = "ne_10m_admin_0_countries"
-        shp_candidates = [
-            os.path.join(self.shapes_path, out_dir, "ne_10m_admin_0_countries.shp"),
-            os.path.join(self.shapes_path, "ne_10m_admin_0_countries.shp"),
-        ]
-        shp_path = self._first_existing(shp_candidates)
+        shp_path = self._shapefile_path("ne_10m_admin_0_countries")
+        cached = self._read_geodata_cache("ukraine", [shp_path])
+        if cached is not None:
+            return cached
 
-        admin0 = gpd.read_file(shp_path)
-        ukraine = admin0[admin0["ADMIN"] == "Ukraine"].to_crs("EPSG:4326")
+        ukraine = gpd.read_file(
+            shp_path, engine="pyogrio", use_arrow=True, where="ADMIN = 'Ukraine'"
+        ).to_crs("EPSG:4326")
         if ukraine.empty:
             raise RuntimeError("Не знайдено полігон України у admin_0")
+        self._write_geodata_cache("ukraine", ukraine)
         return ukraine
 
     def load_regions(self) -> gpd.GeoDataFrame:
@@ -108,17 +268,17 @@ class VisualMap:
             GeoDataFrame: Regions
         """
         
-        out_dir = "ne_10m_admin_1_states_provinces"
-        shp_candidates = [
-            os.path.join(
-                self.shapes_path, out_dir, "ne_10m_admin_1_states_provinces.shp"
-            ),
-            os.path.join(
-                self.shapes_path, "ne_10m_admin_1_states_provinces.shp"
-            ),
-        ]
-        shp_path = self._first_existing(shp_candidates)
-        admin1 = gpd.read_file(shp_path).to_crs("EPSG:4326")
+        shp_path = self._shapefile_path("ne_10m_admin_1_states_provinces")
+        cached = self._read_geodata_cache("regions", [shp_path])
+        if cached is not None:
+            return cached
+
+        # Only Ukrainian oblasts and Crimea rows are used (see add_crimea)
+        admin1 = gpd.read_file(
+            shp_path, engine="pyogrio", use_arrow=True,
+            where="admin = 'Ukraine' OR iso_3166_2 IN ('UA-43', 'UA-40')"
+        ).to_crs("EPSG:4326")
+        self._write_geodata_cache("regions", admin1)
         return admin1
 
     def add_crimea(self, ua_admin0: gpd.GeoDataFrame, admin1_all: gpd.GeoDataFrame) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
@@ -133,12 +293,12 @@ class VisualMap:
         """
         crimea_mask = admin1_all["iso_3166_2"].astype(str).isin(["UA-43", "UA-40"]) if "iso_3166_2" in admin1_all.columns else False
         
-        oblasts_ua = pd.concat([
-            admin1_all[admin1_all.get("admin").astype(str) == "Ukraine"],
-            admin1_all[crimea_mask]
-        ]).drop_duplicates().reset_index(drop=True)
+        # One mask instead of concat + drop_duplicates, which hashes every geometry
+        mask = (admin1_all["admin"].astype(str) == "Ukraine") | crimea_mask
+        oblasts_ua = admin1_all[mask].reset_index(drop=True)
 
-        union_geom = ua_admin0.unary_union.union(oblasts_ua.unary_union)
+        # Single cascaded union over country and oblast polygons instead of two unions plus a merge
+        union_geom = union_all(np.concatenate([ua_admin0.geometry.values, oblasts_ua.geometry.values]))
         ukraine_union = gpd.GeoDataFrame(geometry=[union_geom], crs=ua_admin0.crs)
         return ukraine_union, oblasts_ua
 
@@ -154,31 +314,46 @@ class VisualMap:
         south_latitude = bounds[1] + (bounds[3] - bounds[1]) * 0.15
         return Point(south_longitude, south_latitude)
 
-    def match_targets_to_regions(self) -> List[Tuple[Point, List[dict], any]]:
-        """Find which targets belong to which regions and return the centroids of regions with geometry
+    def _prepared_oblast(self, region_i: int):
+        """Get the cleaned, simplified and prepared boundary of an oblast, preparing it on first use
         
+        Args:
+            region_i: Oblast index in oblasts_3857
+
         Returns:
-            List[Tuple[Point, List[dict], any]]: Region target mapping with full target info
+            PreparedGeometry: Prepared oblast boundary | None
         """
-        _, oblasts = self.add_crimea(self.ukraine, self.regions)
+        if region_i not in self._prepared_oblasts:
+            region_geometry = self.oblasts_3857.geometry.values[region_i]
+            self._prepared_oblasts[region_i] = prep(
+                region_geometry.buffer(0).simplify(self._ICON_REGION_SIMPLIFY_TOLERANCE, preserve_topology=True)
+            ) if region_geometry else None
+        return self._prepared_oblasts[region_i]
+
+    def match_targets_to_regions(self) -> List[Tuple[Point, List[dict], any, any]]:
+        """Find which targets belong to which regions and return the centroids of regions with geometry (EPSG:3857)
         
+        Returns:
+            List[Tuple[Point, List[dict], any, any]]: Region target mapping with full target info and prepared boundary
+        """
         region_target_mapping = []
-        
-        for _, region in oblasts.iterrows():
-            if region.geometry is None:
-                continue
-                
-            region_targets = []
-            for target_info in self.target_data:
-                target_point = target_info['point']
-                target_gdf = gpd.GeoDataFrame([1], geometry=[target_point], crs='EPSG:4326')
-                
-                if target_gdf.within(region.geometry).any():
-                    region_targets.append(target_info)
-            
-            if region_targets:
-                region_centroid = region.geometry.centroid
-                region_target_mapping.append((region_centroid, region_targets, region.geometry))
+        if not self.target_data:
+            return region_target_mapping
+        
+        region_geometries = self.oblasts_3857.geometry.values
+        point_idx, region_idx = self.oblasts_tree.query(self.target_points_3857, predicate='within')
+        
+        # Regions in oblasts order, targets in input order inside each region
+        order = np.lexsort((point_idx, region_idx))
+        point_idx, region_idx = point_idx[order], region_idx[order]
+        regions_hit, starts = np.unique(region_idx, return_index=True)
+        
+        for region_i, region_points in zip(regions_hit, np.split(point_idx, starts[1:])):
+            region_geometry = region_geometries[region_i]
+            region_targets = [self.target_data[i] for i in region_points]
+            region_target_mapping.append(
+                (region_geometry.centroid, region_targets, region_geometry, self._prepared_oblast(region_i))
+            )
         
         return region_target_mapping
 
@@ -188,31 +363,31 @@ class VisualMap:
         Returns:
             GeoDataFrame: Ukraine cities | None
         """
-        out_dir = "ne_10m_populated_places"
-        shp_candidates = [
-            os.path.join(
-                self.shapes_path, out_dir, "ne_10m_populated_places.shp"
-            ),
-            os.path.join(
-                self.shapes_path, "ne_10m_populated_places.shp"
-            ),
-        ]
-        
-        shp_path = self._first_existing(shp_candidates)
+        shp_path = self._shapefile_path("ne_10m_populated_places")
         if not shp_path:
             return None
+        
+        cached = self._read_geodata_cache("cities_ua", [shp_path])
+        if cached is not None:
+            return cached
             
         try:
-            places = gpd.read_file(shp_path).to_crs("EPSG:4326")
-            
-            ukraine_places = places[places.get("ADM0_A3") == "UKR"].copy()
+            ukraine_places = gpd.read_file(
+                shp_path, engine="pyogrio", use_arrow=True, where="ADM0_A3 = 'UKR'"
+            ).to_crs("EPSG:4326")
             if ukraine_places.empty:
                 return None
 
             name_col = next((col for col in ["NAME", "NAME_EN", "NAMEascii"] if col in ukraine_places.columns), "NAME")
             ukraine_places = ukraine_places.rename(columns={name_col: 'city'})
+
+            # Ukrainian names and exclusions are applied once here, not on every render
+            ukraine_places['city'] = ukraine_places['city'].map(UA_NAME_MAP).fillna(ukraine_places['city'])
+            ukraine_places = ukraine_places[~ukraine_places['city'].str.lower().isin(EXCLUDED_CITIES)]
             
-            return ukraine_places[["city", "geometry"]]
+            cities = ukraine_places[["city", "geometry"]].reset_index(drop=True)
+            self._write_geodata_cache("cities_ua", cities)
+            return cities
         except Exception:
             return None
     
@@ -231,15 +406,14 @@ class VisualMap:
         fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
         return fig, ax, dpi
 
-    def _setup_map_bounds_and_basemap(self, ax, ukraine_3857) -> None:
-        """Setup map bounds and add base map
+    def _map_limits(self, ukraine_3857) -> tuple[tuple, tuple]:
+        """Get map X/Y limits fitting Ukraine into a 16:9 frame
         
         Args:
-            ax: Axes object
             ukraine_3857: Ukraine GeoDataFrame
 
         Returns:
-            None
+            tuple[tuple, tuple]: X limits, Y limits
         """
         bounds = ukraine_3857.total_bounds
         minx, miny, maxx, maxy = bounds
@@ -262,15 +436,70 @@ class VisualMap:
             miny -= delta
             maxy += delta
 
-        ax.set_xlim(minx - width * pad, maxx + width * pad)
-        ax.set_ylim(miny - height * pad, maxy + height * pad)
+        xlim = (minx - width * pad, maxx + width * pad)
+        ylim = (miny - height * pad, maxy + height * pad)
+        return xlim, ylim
 
-        ctx.add_basemap(
-            ax,
-            source=ctx.providers.CartoDB.DarkMatterNoLabels,
-            attribution=False,
-            alpha=1.0
-        )
+    def _setup_map_bounds_and_basemap(self, ax, ukraine_3857) -> bool:
+        """Setup map bounds and add base map
+        
+        Args:
+            ax: Axes object
+            ukraine_3857: Ukraine GeoDataFrame
+
+        Returns:
+            bool: True if the basemap was drawn
+        """
+        xlim, ylim = self._map_limits(ukraine_3857)
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+
+        basemap = self._load_basemap(xlim, ylim)
+        if basemap is None:
+            return False
+
+        image, extent = basemap
+        ax.imshow(image, extent=extent, interpolation='bilinear', alpha=1.0)
+        ax.axis((*xlim, *ylim))
+        return True
+
+    def _load_basemap(self, xlim: tuple, ylim: tuple) -> tuple | None:
+        """Get basemap raster for the map bounds, downloading tiles only when there is no cached image
+        
+        Args:
+            xlim: Map X limits (EPSG:3857)
+            ylim: Map Y limits (EPSG:3857)
+
+        Returns:
+            tuple: Image array, extent | None
+        """
+        # Bounds only change with the shapefiles, so one stitched image serves every render
+        bounds = np.array((*xlim, *ylim), dtype=float)
+        cache_file = os.path.join(self.cache_path, "basemap.npz")
+        try:
+            with np.load(cache_file) as cached:
+                if np.allclose(cached['bounds'], bounds):
+                    return cached['image'], tuple(cached['extent'].tolist())
+        except Exception:
+            pass
+
+        try:
+            ctx.set_cache_dir(os.path.join(self.cache_path, "ctx_tiles"))
+            image, extent = ctx.bounds2img(
+                xlim[0], ylim[0], xlim[1], ylim[1],
+                source=ctx.providers.CartoDB.DarkMatterNoLabels,
+                ll=False
+            )
+        except Exception as e:
+            logger.warning(f"Basemap tiles unavailable, drawing map without basemap: {e}")
+            return None
+
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            np.savez(cache_file, image=image, extent=np.asarray(extent, dtype=float), bounds=bounds)
+        except Exception:
+            pass
+        return image, extent
 
     def _draw_ukraine_and_regions(self, ax, ukraine_3857, oblasts_3857) -> None:
         """Draw Ukraine territory and region borders
@@ -302,13 +531,11 @@ class VisualMap:
         Returns:
             None
         """
-        if 'city' in self.cities.columns:
-            self.cities['city'] = self.cities['city'].apply(lambda x: UA_NAME_MAP.get(x, x))
-
-        cities_3857 = self.cities.to_crs(3857)
-        cities_filtered = cities_3857[~cities_3857['city'].str.lower().isin(EXCLUDED_CITIES)]
+        cities_3857 = self.cities_3857
+        if cities_3857 is None or cities_3857.empty:
+            return
 
-        cities_filtered.plot(
+        cities_3857.plot(
             ax=ax,
             color=COLORS['city_point'],
             markersize=4,
@@ -317,19 +544,12 @@ class VisualMap:
             linewidth=0.5,
         )
 
-        for _, row in cities_filtered.iterrows():
-            name = str(row['city'])
-            ax.text(
-                row.geometry.x,
-                row.geometry.y + 15000,
-                name,
-                fontsize=5,
-                color=COLORS['city_label'],
-                ha='center',
-                va='bottom',
-                weight='bold',
-                alpha=0.95,
-            )
+        xs = cities_3857.geometry.x.to_numpy()
+        ys = cities_3857.geometry.y.to_numpy() + 15000
+        names = cities_3857['city'].astype(str).to_numpy()
+        text_kwargs = self._city_label_kwargs
+        for x, y, name in zip(xs.tolist(), ys.tolist(), names):
+            ax.text(x, y, name, **text_kwargs)
 
     def _canon_weapon_type(self, value: str) -> str:
         """Return canonical weapon type: 'БпЛА' | 'х101' | 'Балістика'
@@ -342,68 +562,45 @@ class VisualMap:
         """
         if not value:
             return 'БпЛА'
-        
-        s = str(value).strip().lower()
-        
-        match s:
-            case 'uav' | 'бпла' | 'дрон' | 'дрон-камікадзе' | 'шахед' | 'shahed' | 'гермес' | 'бпа' | 'бплА':
-                return 'БпЛА'
-            case 'x101' | 'х101' | 'крилата ракета' | 'крилатая ракета' | 'cruise' | 'cruise_missile':
-                return 'х101'
-            case 'balistic' | 'ballistic' | 'балістика' | 'баллистика' | 'кинжал' | 'kinzhal':
-                return 'Балістика'
-            case _:
-                return 'БпЛА'
+        return _WEAPON_CANON.get(str(value).strip().lower(), 'БпЛА')
 
-    def _parse_svg_to_paths(self, icon_path: str) -> Optional[List]:
-        """Cached function for parsing SVG
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _parse_svg_to_paths(icon_path: str) -> Optional[Tuple]:
+        """Parse SVG icon once per process into paths centered on the origin and scaled to unit size
         
         Args:
             icon_path: Path to the SVG icon
 
         Returns:
-            List: List of paths
+            Tuple: Normalized paths | None
         """
-        cache_key = f"svg_{icon_path}"
-        if cache_key in self._svg_cache:
-            return self._svg_cache[cache_key]
-        
         try:
             tree = ET.parse(icon_path)
             root = tree.getroot()
             
             ns = '{http://www.w3.org/2000/svg}'
             path_elems = list(root.iter(ns+'path')) if root.tag.startswith('{') else list(root.iter('path'))
-            
-            if not path_elems:
-                self._svg_cache[cache_key] = None
+
+            mpl_paths = [parse_path(p.get('d')) for p in path_elems if p.get('d')]
+            vertices = [mpl_path.vertices for mpl_path in mpl_paths if mpl_path.vertices.size > 0]
+            if not vertices:
                 return None
 
-            min_x, min_y, max_x, max_y = float('inf'), float('inf'), float('-inf'), float('-inf')
-            mpl_paths = []
-            
-            for p in path_elems:
-                d = p.get('d')
-                if d:
-                    mpl_path = parse_path(d)
-                    mpl_paths.append(mpl_path)
-                    verts = mpl_path.vertices
-                    if verts.size > 0:
-                        min_x = min(min_x, float(np.min(verts[:, 0])))
-                        min_y = min(min_y, float(np.min(verts[:, 1])))
-                        max_x = max(max_x, float(np.max(verts[:, 0])))
-                        max_y = max(max_y, float(np.max(verts[:, 1])))
-
-            result = {
-                'paths': mpl_paths,
-                'bounds': (min_x, min_y, max_x, max_y)
-            }
-            
-            self._svg_cache[cache_key] = result
-            return result
+            all_verts = np.concatenate(vertices)
+            min_x, min_y = all_verts.min(axis=0)
+            max_x, max_y = all_verts.max(axis=0)
+
+            content_w = max(max_x - min_x, 1e-6)
+            content_h = max(max_y - min_y, 1e-6)
+            normalize = (
+                transforms.Affine2D()
+                .translate(-(min_x + max_x) / 2.0, -(min_y + max_y) / 2.0)
+                .scale(1.0 / max(content_w, content_h))
+            )
+            return tuple(mpl_path.transformed(normalize) for mpl_path in mpl_paths)
             
-        except Exception as e:
-            self._svg_cache[cache_key] = None
+        except Exception:
             return None
 
     def _add_svg_icon_patch(self, ax, weapon_type, angle_radians, arrow_color, x, y) -> None:
@@ -422,13 +619,10 @@ class VisualMap:
         """
         icon_path = WEAPON_ICONS.get(weapon_type, WEAPON_ICONS['БпЛА'])
         
-        svg_data = self._parse_svg_to_paths(icon_path)
-        if not svg_data:
+        mpl_paths = self._parse_svg_to_paths(icon_path)
+        if not mpl_paths:
             return
         
-        mpl_paths = svg_data['paths']
-        min_x, min_y, max_x, max_y = svg_data['bounds']
-        
         ax_w = ax.get_xlim()[1] - ax.get_xlim()[0]
         icon_w = ax_w * 0.015
         
@@ -438,19 +632,12 @@ class VisualMap:
             data_dx = ax.transData.inverted().transform(p1)[0] - ax.transData.inverted().transform(p0)[0]
             icon_w += data_dx
 
-        content_w = max(max_x - min_x, 1e-6)
-        content_h = max(max_y - min_y, 1e-6)
-        content_cx = (min_x + max_x) / 2.0
-        content_cy = (min_y + max_y) / 2.0
-        scale_ratio = icon_w / max(content_w, content_h)
-
         angle_deg = np.degrees(angle_radians)
         icon_offset = WEAPON_ICON_ROTATION_OFFSET_DEG.get(weapon_type, 0.0)
         
         transform = (
             transforms.Affine2D()
-            .translate(-content_cx, -content_cy)
-            .scale(scale_ratio)
+            .scale(icon_w)
             .rotate_deg(angle_deg + icon_offset)
             .translate(x, y)
         ) + ax.transData
@@ -466,45 +653,46 @@ class VisualMap:
             )
             ax.add_patch(patch)
     
-    def _find_icon_position(self, target_xy, base_angle, region_boundary, placed_positions) -> Tuple[float, float, float]:
+    def _find_icon_position(self, target_xy, base_angle, region_prepared, placed_positions) -> Tuple[float, float, float]:
         """Find the best position for the icon, avoiding overlaps
         
         Args:
             target_xy: Target coordinates
             base_angle: Base angle
-            region_boundary: Region boundary
+            region_prepared: Prepared region boundary | None
             placed_positions: Placed positions
 
         Returns:
             Tuple[float, float, float]: X, Y, angle
         """
-        distances = (15000, 20000, 24000, 28000)
+        distances = np.array((15000, 20000, 24000, 28000), dtype=float)
         min_separation = 18000
         
-        angle_offsets = (0, 0.26, -0.26, 0.52, -0.52, 0.79, -0.79, 1.05, -1.05)
-        for dist in distances:
-            for offset in angle_offsets:
-                angle = base_angle + offset
-                x = target_xy.x - np.cos(angle) * dist
-                y = target_xy.y - np.sin(angle) * dist
-                
-                too_close = any(
-                    np.hypot(x - px, y - py) < min_separation 
-                    for px, py in placed_positions
-                )
-                if too_close:
-                    continue
-                
-                if region_boundary and not region_boundary.buffer(0).contains(Point(x, y)):
-                    continue
-                    
-                return x, y, angle
+        angle_offsets = np.array((0, 0.26, -0.26, 0.52, -0.52, 0.79, -0.79, 1.05, -1.05))
+
+        # All candidates at once, ordered by distance first and angle offset second
+        angles = np.broadcast_to(base_angle + angle_offsets[None, :], (distances.size, angle_offsets.size)).ravel()
+        dists = np.repeat(distances, angle_offsets.size)
+        xs = target_xy.x - np.cos(angles) * dists
+        ys = target_xy.y - np.sin(angles) * dists
+
+        candidates = np.arange(angles.size)
+        if placed_positions:
+            placed = np.asarray(placed_positions, dtype=float)
+            d2 = ((xs[None, :] - placed[:, 0:1]) ** 2 + (ys[None, :] - placed[:, 1:2]) ** 2).min(axis=0)
+            candidates = candidates[d2 >= min_separation ** 2]
+
+        for i in candidates.tolist():
+            x, y = float(xs[i]), float(ys[i])
+            if region_prepared is not None and not region_prepared.contains(Point(x, y)):
+                continue
+            return x, y, float(angles[i])
         
         x = target_xy.x - np.cos(base_angle) * distances[-1]
         y = target_xy.y - np.sin(base_angle) * distances[-1]
         return x, y, base_angle
 
-    def _draw_weapon_icon_and_line(self, ax, weapon_type, target_xy, angle, arrow_color, region_boundary, placed_positions) -> Tuple[float, float]:
+    def _draw_weapon_icon_and_line(self, ax, weapon_type, target_xy, angle, arrow_color, region_prepared, placed_positions) -> Tuple[float, float]:
         """Draw weapon icon and line on the map
         
         Args:
@@ -513,13 +701,13 @@ class VisualMap:
             target_xy: Target coordinates
             angle: Angle of the arrow
             arrow_color: Color of the arrow
-            region_boundary: Region boundary
+            region_prepared: Prepared region boundary | None
             placed_positions: Placed positions
 
         Returns:
             Tuple[float, float]: Icon coordinates (x, y)
         """
-        icon_x, icon_y, used_angle = self._find_icon_position(target_xy, angle, region_boundary, placed_positions)
+        icon_x, icon_y, used_angle = self._find_icon_position(target_xy, angle, region_prepared, placed_positions)
         placed_positions.append((icon_x, icon_y))
 
         self._add_svg_icon_patch(ax, weapon_type, used_angle, arrow_color, icon_x, icon_y)
@@ -563,31 +751,25 @@ class VisualMap:
         self.region_target_mapping = self.match_targets_to_regions()
         
         for region_data in self.region_target_mapping:
-            _, region_targets = region_data[:2]
-            region_geometry = region_data[2] if len(region_data) > 2 else None
-            
-            region_boundary = None
-            if region_geometry:
-                region_geom_3857 = gpd.GeoDataFrame([1], geometry=[region_geometry], crs='EPSG:4326').to_crs(3857)
-                region_boundary = region_geom_3857.iloc[0].geometry
+            # Prepared (EPSG:3857) boundary is shared by all icon candidates of the region
+            _, region_targets, _, region_prepared = region_data
             
             placed_positions = []
             
             for target_data_item in region_targets:
                 if isinstance(target_data_item, dict):
-                    target_point = target_data_item['point']
+                    # Projected once for all targets in _get_target_data
+                    target_xy = Point(target_data_item['x'], target_data_item['y'])
                     weapon_type = target_data_item['weapon_type']
                     weapon_count = target_data_item['count']
-                elif isinstance(target_data_item, tuple) and len(target_data_item) == 2:
-                    target_point, weapon_type = target_data_item
-                    weapon_count = 1 
                 else:
-                    target_point = target_data_item
-                    weapon_type = 'БпЛА'
+                    if isinstance(target_data_item, tuple) and len(target_data_item) == 2:
+                        target_point, weapon_type = target_data_item
+                    else:
+                        target_point = target_data_item
+                        weapon_type = 'БпЛА'
                     weapon_count = 1
-                
-                target_gdf = gpd.GeoDataFrame([1], geometry=[target_point], crs='EPSG:4326').to_crs(3857)
-                target_xy = target_gdf.iloc[0].geometry
+                    target_xy = Point(self._to_3857.transform(target_point.x, target_point.y))
                 
                 canonical_type = self._canon_weapon_type(weapon_type)
                 arrow_color = WEAPON_COLORS.get(canonical_type, COLORS['arrow'])
@@ -595,7 +777,7 @@ class VisualMap:
                 base_angle = np.pi * 3/4
                 angle = base_angle + random.uniform(-np.pi/24, np.pi/24)
                 
-                icon_x, icon_y = self._draw_weapon_icon_and_line(ax, canonical_type, target_xy, angle, arrow_color, region_boundary, placed_positions)
+                icon_x, icon_y = self._draw_weapon_icon_and_line(ax, canonical_type, target_xy, angle, arrow_color, region_prepared, placed_positions)
                 
                 self._add_weapon_count_text(ax, icon_x, icon_y, weapon_count)
 
@@ -631,20 +813,7 @@ class VisualMap:
         Returns:
             Image.Image: Final image with digital information
         """
-        counts: dict[str, int] = {}
-        try:
-            for region in self.full_json_data.get('regions', []):
-                for tgt in region.get('targets', []):
-                    wtype = tgt.get('weapon_type')
-                    c = int(tgt.get('count', 1) or 1)
-                    canonical = self._canon_weapon_type(wtype)
-                    counts[canonical] = counts.get(canonical, 0) + c
-        except Exception:
-            for target_info in self.target_data:
-                wtype = target_info.get('weapon_type', 'БпЛА')
-                c = int(target_info.get('count', 1) or 1)
-                canonical = self._canon_weapon_type(wtype)
-                counts[canonical] = counts.get(canonical, 0) + c
+        counts = self._weapon_counts
 
         dt_str = datetime.now(ZoneInfo('Europe/Kyiv')).strftime('%d.%m.%Y %H:%M')
         
@@ -652,7 +821,7 @@ class VisualMap:
         draw = ImageDraw.Draw(img)
         W, H = 1920, 1080
         
-        font = ImageFont.truetype(font_manager.findfont('DejaVu Sans'), 28)
+        font = self._FONT_28
         default_color = WEAPON_COLORS.get('БпЛА', '#CE983C')
         
         x, y = 24, H - 280
@@ -693,7 +862,7 @@ class VisualMap:
         Returns:
             None
         """
-        big_font = ImageFont.truetype(font_manager.findfont('DejaVu Sans'), 30)
+        big_font = self._FONT_30
         
         
         current_y = y
@@ -720,7 +889,7 @@ class VisualMap:
             None
         """
         source_text = f"Data visualized based on TG channel: {self.channel_name or "@kudy_letyt"}"
-        small_font = ImageFont.truetype(font_manager.findfont('DejaVu Sans'), 16)
+        small_font = self._FONT_16
         text_color = (255, 255, 255, 128)
         draw.text((x, y), source_text, font=small_font, fill=text_color)
         
@@ -755,59 +924,138 @@ class VisualMap:
         total_height = sum(height for height, _ in line_heights) + (len(lines) - 1) * 5
         w, h = max_width + 36, total_height + 20
         
-        overlay = Image.new(
-            'RGBA',
-            (W, H),
-            (0, 0, 0, 0)
-        )
+        # Overlay covers only the panel (plus outline margin), not the whole frame
+        pad = 2
+        overlay = Image.new('RGBA', (w + 2 * pad + 1, h + 2 * pad + 1), (0, 0, 0, 0))
 
         ov_draw = ImageDraw.Draw(overlay)
         ov_draw.rounded_rectangle(
-            (x, y, x + w, y + h),
+            (pad, pad, pad + w, pad + h),
             radius=12, 
             fill=(11, 13, 17, 230),
             outline=(26, 32, 44, 255),
             width=2
         )
         
-        current_y = y + 10
+        current_y = pad + 10
         for i, line in enumerate(lines):
             line_height, y_offset = line_heights[i]
-            tx = x + 18
+            tx = pad + 18
             ty = current_y - y_offset
             ov_draw.text((tx, ty), line, font=font, fill=color)
             current_y += line_height + 5  
         
-        base_img = Image.new('RGBA', (W, H))
-        base_img.alpha_composite(overlay)
-        draw._image.alpha_composite(base_img)
+        draw._image.alpha_composite(overlay, dest=(x - pad, y - pad))
 
-    def _finalize_and_save_map(self, fig, ax, dpi) -> None:
-        """Finalize and save the map
+    def _figure_to_image(self, fig, ax, dpi, facecolor) -> Image.Image:
+        """Finalize the figure layout and take its Agg pixel buffer as an image
         
         Args:
             fig: Figure object
             ax: Axes object
             dpi: DPI of the map
+            facecolor: Figure background color
 
         Returns:
-            True if the map is saved successfully
+            Image.Image: RGBA image of the figure
         """
         ax.set_aspect('equal')
         ax.set_axis_off()
         ax.grid(False)
         plt.tight_layout(pad=0)
 
-        buf = BytesIO()
-        fig.savefig(buf, dpi=dpi, bbox_inches=None, pad_inches=0, facecolor=COLORS['background'], edgecolor='none', format='png')
-        buf.seek(0)
+        # Take the Agg pixel buffer directly instead of a PNG encode/decode round-trip
+        fig.set_dpi(dpi)
+        fig.set_facecolor(facecolor)
+        fig.set_edgecolor('none')
+        fig.canvas.draw()
+        w, h = fig.canvas.get_width_height()
+        return Image.frombuffer('RGBA', (w, h), fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1).copy()
+
+    def _static_base_sources(self) -> List[str | None]:
+        """Get shapefiles the static base render is built from
+        
+        Returns:
+            List[str | None]: Source paths
+        """
+        return [
+            self._shapefile_path("ne_10m_admin_0_countries"),
+            self._shapefile_path("ne_10m_admin_1_states_provinces"),
+            self._shapefile_path("ne_10m_populated_places"),
+        ]
+
+    def _read_static_base_cache(self) -> Image.Image | None:
+        """Read static base render from cache if it is up to date
+        
+        Returns:
+            Image.Image: Static base render | None
+        """
+        cache_file = os.path.join(self.cache_path, "base_render.npy")
+        try:
+            if not self._is_cache_fresh(cache_file, self._static_base_sources()):
+                return None
+            return Image.fromarray(np.load(cache_file))
+        except Exception:
+            return None
+
+    def _render_static_base(self) -> Image.Image:
+        """Render layers that do not depend on targets: basemap, Ukraine, oblasts and cities
+        
+        Returns:
+            Image.Image: Static base render
+        """
+        fig, ax, dpi = self._setup_figure_and_axes()
+        basemap_drawn = self._setup_map_bounds_and_basemap(ax, self.ukraine_3857)
+        self._draw_ukraine_and_regions(ax, self.ukraine_3857, self.oblasts_3857)
+        self._draw_cities(ax)
+        base_img = self._figure_to_image(fig, ax, dpi, COLORS['background'])
+        plt.close(fig)
+
+        # A render without basemap tiles is not cached, so tiles are retried next time
+        if basemap_drawn:
+            try:
+                os.makedirs(self.cache_path, exist_ok=True)
+                np.save(os.path.join(self.cache_path, "base_render.npy"), np.asarray(base_img))
+            except Exception:
+                pass
+        return base_img
+
+    def _render_dynamic(self, base_img: Image.Image) -> Image.Image:
+        """Render target arrows on a transparent layer and composite them over the static base
+        
+        Args:
+            base_img: Static base render
+
+        Returns:
+            Image.Image: Map image with arrows
+        """
+        fig, ax, dpi = self._setup_figure_and_axes()
+        fig.set_facecolor('none')
+        ax.set_facecolor('none')
+        xlim, ylim = self._map_limits(self.ukraine_3857)
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+
+        self._draw_arrows(ax)
+
+        arrows_img = self._figure_to_image(fig, ax, dpi, 'none')
+        plt.close(fig)
+        return Image.alpha_composite(base_img, arrows_img)
+
+    def _finalize_and_save_map(self, map_img: Image.Image) -> None:
+        """Finalize and save the map
+        
+        Args:
+            map_img: Map image with arrows
 
-        base_img = Image.open(buf)
-        final_img = self._add_digital_information(base_img)
+        Returns:
+            True if the map is saved successfully
+        """
+        final_img = self._add_digital_information(map_img)
         if final_img.size != (1920, 1080):
             final_img = final_img.resize((1920, 1080), Image.Resampling.LANCZOS)
         name = datetime.now(ZoneInfo('Europe/Kyiv')).strftime('%d.%m.%Y;%H:%M')
-        final_img.save(f'gened_maps/map_{name}.png')
+        final_img.save(f'gened_maps/map_{name}.png', optimize=False, compress_level=1)
         return True
 
     def create_map(self) -> None:
@@ -816,30 +1064,10 @@ class VisualMap:
         Returns:
             None
         """
-        
-        fig, ax, dpi = self._setup_figure_and_axes()
-        
-        ukraine_id = id(self.ukraine)
-        regions_id = id(self.regions)
-        
-        cache_key_3857 = f"ukraine_3857_{ukraine_id}_{regions_id}"
-        cache_key_oblasts = f"oblasts_3857_{ukraine_id}_{regions_id}"
-        
-        if cache_key_3857 not in self._geodata_cache:
-            ukraine_area, oblasts = self.add_crimea(self.ukraine, self.regions)
-            ukraine_3857 = ukraine_area.to_crs(3857)
-            oblasts_3857 = oblasts.to_crs(3857)
-            
-            self._geodata_cache[cache_key_3857] = ukraine_3857
-            self._geodata_cache[cache_key_oblasts] = oblasts_3857
-        else:
-            ukraine_3857 = self._geodata_cache[cache_key_3857]
-            oblasts_3857 = self._geodata_cache[cache_key_oblasts]
-        
-        self._setup_map_bounds_and_basemap(ax, ukraine_3857)
-        
-        self._draw_ukraine_and_regions(ax, ukraine_3857, oblasts_3857)
-        self._draw_cities(ax)
-        self._draw_arrows(ax)
-        
-        self._finalize_and_save_map(fig, ax, dpi)
\ No newline at end of file
+        # Static layers only change with the shapefiles, config or renderer, so they are rendered once and reused
+        base_img = self._read_static_base_cache()
+        if base_img is None:
+            base_img = self._render_static_base()
+
+        map_img = self._render_dynamic(base_img)
+        self._finalize_and_save_map(map_img)
\ No newline at end of file
@@ -12,8 +12,8 @@ async def main():
     print(cleared_message)
 
     
-    ai = AIConverter()
-    ai_result = ai.proccess_data(cleared_message, max_workers=2)
+    ai = AIConverter(max_workers=2)
+    ai_result = await ai.proccess_data(cleared_message)
     
     logger.info(f"Processed {ai_result['total_cities']} cities")
     logger.info(f"Total number of weapons: {ai_result['total_weapons_count']}")
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from loguru import logger
+
+from core.ai_converter import AIConverter, SQLiteFlow
+
+logger.remove()
+
+
+class BulkCityLookupTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = SQLiteFlow(os.path.join(self.tmp.name, "cities.db"))
+        self.db.save_city_coordinates_bulk([
+            ("Бровари", "Київщина", 50.51, 30.79, 0.9, "AI"),
+            ("Фастів", "Київщина", 50.07, 29.91, 0.9, "AI"),
+            ("Бровари", "Чернігівщина", 51.0, 31.0, 0.9, "AI"),
+        ])
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_bulk_lookup_matches_city_and_region(self):
+        found = self.db.get_cities_coordinates_bulk([
+            ("Бровари", "київщина"), ("Фастів", "Київщина"), ("Ніжин", "Київщина"),
+        ])
+
+        self.assertEqual(set(found), {("Бровари", "Київщина"), ("Фастів", "Київщина")})
+        self.assertAlmostEqual(found[("Бровари", "Київщина")].latitude, 50.51)
+
+    def test_bulk_lookup_query_searches_index(self):
+        conn = self.db._get_connection()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            self.db.get_cities_coordinates_bulk([("Бровари", "Київщина"), ("Фастів", "Київщина")])
+        finally:
+            conn.set_trace_callback(None)
+
+        lookups = [sql for sql in statements if "FROM cities" in sql]
+        self.assertEqual(len(lookups), 1)
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {lookups[0]}").fetchall()
+
+        details = " ".join(row[-1] for row in plan)
+        self.assertIn("SEARCH", details)
+        self.assertNotIn("SCAN", details)
+
+
+class ExtractWeaponInfoTest(unittest.TestCase):
+    def setUp(self):
+        # extract_weapon_info needs no model or database
+        self.converter = AIConverter.__new__(AIConverter)
+
+    def test_directions_are_grouped_by_region(self):
+        text = "Київщина:\n2х шахеди курсом на Бровари\n2 групи КР курсом на Київ"
+
+        self.assertEqual(self.converter.extract_weapon_info(text), {
+            "Київщина": [
+                {"weapon_type": "шахеди", "count": 2, "target_city": "Бровари"},
+                {"weapon_type": "Х101", "count": 4, "target_city": "Київ"},
+            ]
+        })
+
+    def test_direction_without_target_is_ignored(self):
+        text = "Київщина:\nшахед курсом на  \nКР курсом на \r\nгрупи КР курсом на \t\n"
+
+        self.assertEqual(self.converter.extract_weapon_info(text), {"Київщина": []})
+
+    def test_crlf_lines_keep_target(self):
+        text = "Сумщина:\r\nшахед курсом на Суми\r\n"
+
+        self.assertEqual(self.converter.extract_weapon_info(text), {
+            "Сумщина": [{"weapon_type": "шахед", "count": 1, "target_city": "Суми"}]
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()